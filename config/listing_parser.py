@@ -4,21 +4,117 @@ Uses LangChain and vector database for intelligent information retrieval
 """
 
 import os
+import re
+import mmap
+import hashlib
+import shutil
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, NamedTuple
 from pathlib import Path
 
+import numpy as np
+import orjson
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_community.vectorstores import Chroma
 from langchain.schema import Document
+from langchain.embeddings import CacheBackedEmbeddings
+from langchain.storage import LocalFileStore
 from langchain.retrievers import ContextualCompressionRetriever
 from langchain.retrievers.document_compressors import LLMChainExtractor
 
 from .mistral_embeddings import MistralEmbeddings
+from .vector_index import InMemoryVectorIndex
+
+__all__ = [
+    'Hit',
+    'RAGPropertyParser',
+    'get_property_parser'
+]
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Embedding and splitter caches kept inside the persist directory, they survive database rebuilds
+EMBEDDING_MODEL = "mistral-embed"
+EMBEDDING_CACHE_DIR = "emb_cache"
+SPLITS_CACHE_FILE = "splits.json"
+PRESERVED_PERSIST_ENTRIES = (EMBEDDING_CACHE_DIR, SPLITS_CACHE_FILE)
+
+# Text splitter settings, also part of the splitter cache key
+CHUNK_SIZE = 1000
+CHUNK_OVERLAP = 200
+
+# Fixed queries used internally, their embeddings are computed once and reused
+OVERVIEW_QUERY = "property overview amenities location"
+SUMMARY_QUERY = "property name location amenities check-in check-out"
+CONSTANT_QUERIES = (OVERVIEW_QUERY, SUMMARY_QUERY)
+
+# Vector search results remembered per parser, least recently used are evicted first
+QUERY_CACHE_SIZE = 256
+
+# Query embeddings remembered per parser, keyed by model and normalized query text
+QUERY_EMBEDDING_CACHE_SIZE = 4096
+
+# Data files at least this large are read through mmap instead of read_text()
+MMAP_MIN_FILE_SIZE = 1024 * 1024
+
+# Merge pass after splitting: adjacent chunks are joined up to this size,
+# and chunks shorter than the minimum are always folded into their neighbor
+MERGED_CHUNK_SIZE = 1150
+MIN_CHUNK_SIZE = 100
+
+# Summary categories in priority order: icon and the keywords that select it.
+# The time-of-day category also needs one of the time keywords
+_SUMMARY_CATEGORIES = (
+    ("🏠", ("property", "name")),
+    ("📍", ("location", "metro")),
+    ("⏰", ("check",)),
+    ("✨", ("wifi", "amenity")),
+)
+_SUMMARY_TIME_ICON = "⏰"
+_SUMMARY_TIME_KEYWORDS = ("pm", "am")
+
+# All summary keywords found in one scan of the lowercased content. The lookahead
+# reports overlapping hits ("am" inside "name"); at one position the longest keyword
+# wins, so each keyword also implies the keywords it starts with ("amenity" -> "am")
+_SUMMARY_KEYWORDS = sorted(
+    {keyword for _, keywords in _SUMMARY_CATEGORIES for keyword in keywords} | set(_SUMMARY_TIME_KEYWORDS),
+    key=len, reverse=True
+)
+_SUMMARY_KEYWORD_RE = re.compile("(?=(" + "|".join(map(re.escape, _SUMMARY_KEYWORDS)) + "))")
+_SUMMARY_IMPLIED_KEYWORDS = {
+    keyword: frozenset(other for other in _SUMMARY_KEYWORDS if keyword.startswith(other))
+    for keyword in _SUMMARY_KEYWORDS
+}
+
+# HNSW settings for new collections, sized for a small corpus queried with k <= 5.
+# Mistral embeddings are unit length, so cosine ranks the same as the old l2 default
+COLLECTION_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:search_ef": 16,
+    "hnsw:construction_ef": 64,
+    "hnsw:M": 16,
+}
+
+# SQLite settings applied to the Chroma database before bulk ingestion when FAST_INGEST=1
+FAST_INGEST_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+class Hit(NamedTuple):
+    """A retrieved property chunk; use _asdict() where a plain dict is needed (e.g. JSON)"""
+    content: str
+    metadata: Dict[str, Any]
+    relevance_score: float
+    source: str
+
+
 class RAGPropertyParser:
     """RAG-based property information parser using LangChain and vector database"""
     
@@ -40,9 +136,39 @@ class RAGPropertyParser:
             self.persist_directory = Path(persist_directory).resolve()
         
         self.vector_store = None
+        self.memory_index = None
         self.embeddings = None
         self.text_splitter = None
         
+        # Bumped whenever the data is reloaded, so callers can key caches on it
+        self.data_version = 0
+        
+        # Hash of the data files' contents, unlike data_version it is stable across restarts
+        self.data_fingerprint = ""
+        
+        # General AI context is identical for every message until the data changes
+        self._general_context = None
+        
+        # Resolved category lookups keyed by normalized category name
+        self._specific_info: Dict[str, str] = {}
+        
+        # Database stats only change when the data is reloaded
+        self._database_stats: Optional[Dict[str, Any]] = None
+        
+        # LRU of vector search results keyed by (query, k), cleared when the database is rebuilt
+        self._query_cache: OrderedDict = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        
+        # Embeddings of the constant internal queries, they don't depend on the data
+        self._constant_query_vectors: Dict[str, np.ndarray] = {}
+        
+        # LRU of other query embeddings, valid across rebuilds since they don't depend on the data
+        self._query_vectors: OrderedDict = OrderedDict()
+        self._query_vectors_lock = threading.Lock()
+        
+        # Loaded data files keyed by path, with the mtime they were read at
+        self._document_cache: Dict[str, Tuple[float, Document]] = {}
+        
         # Initialize components
         self._initialize_components()
         
@@ -53,16 +179,21 @@ class RAGPropertyParser:
         """Initialize LangChain components"""
         # Initialize text splitter for chunking documents
         self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000,
-            chunk_overlap=200,
+            chunk_size=CHUNK_SIZE,
+            chunk_overlap=CHUNK_OVERLAP,
             length_function=len,
             separators=["\n\n", "\n", ". ", " ", ""]
         )
         
-        # Initialize Mistral embeddings model
-        self.embeddings = MistralEmbeddings(
-            model="mistral-embed",
-            api_key=os.getenv("MISTRAL_API_KEY")
+        # Initialize Mistral embeddings model, cached on disk by content hash so
+        # unchanged chunks are never re-embedded when the database is rebuilt
+        self.embeddings = CacheBackedEmbeddings.from_bytes_store(
+            underlying_embeddings=MistralEmbeddings(
+                model=EMBEDDING_MODEL,
+                api_key=os.getenv("MISTRAL_API_KEY")
+            ),
+            document_embedding_cache=LocalFileStore(str(self.persist_directory / EMBEDDING_CACHE_DIR)),
+            namespace=EMBEDDING_MODEL
         )
         
         logger.info("LangChain components initialized successfully with Mistral embeddings")
@@ -91,9 +222,38 @@ class RAGPropertyParser:
         else:
             logger.info("Creating new vector database...")
             self._create_vector_database()
-            
+        
+        self._build_memory_index()
+        self.data_fingerprint = self._fingerprint_documents(self._collect_documents())
         logger.info("Vector database setup completed")
     
+    @staticmethod
+    def _fingerprint_documents(documents: List[Document]) -> str:
+        """Hash the names and contents of the data files"""
+        digest = hashlib.blake2b(digest_size=16)
+        for doc in documents:
+            digest.update(f"{doc.metadata.get('filename', '')}\0{doc.page_content}\0".encode("utf-8"))
+        return digest.hexdigest()
+    
+    def _build_memory_index(self):
+        """Mirror a small Chroma collection into an in-memory index for brute-force search"""
+        self.memory_index = None
+        if not self.vector_store:
+            return
+        
+        # For a few thousand chunks an exact matrix search beats querying HNSW through Chroma
+        max_chunks = int(os.getenv("IN_MEMORY_INDEX_MAX_CHUNKS", "10000"))
+        try:
+            collection = self.vector_store._collection
+            count = collection.count()
+            if 0 < count <= max_chunks:
+                self.memory_index = InMemoryVectorIndex.from_collection(
+                    collection,
+                    quantize=os.getenv("IN_MEMORY_INDEX_INT8", "true").lower() == "true"
+                )
+        except Exception as e:
+            logger.warning(f"Could not build in-memory vector index: {e}, using Chroma search")
+    
     def _is_docker_environment(self):
         """Check if we're running in a Docker container"""
         return os.path.exists('/.dockerenv') or os.getenv('PYTHONPATH') == '/app'
@@ -108,7 +268,7 @@ class RAGPropertyParser:
             documents = [self._create_default_document()]
         
         # Split documents into chunks
-        chunks = self.text_splitter.split_documents(documents)
+        chunks = self._merge_chunks(self._split_documents(documents))
         logger.info(f"Created {len(chunks)} text chunks from {len(documents)} documents")
         
         # Check if we're in Docker
@@ -119,32 +279,17 @@ class RAGPropertyParser:
         # Create in-memory database first (no persist_directory)
         try:
             logger.info("Creating in-memory database...")
-            self.vector_store = Chroma.from_documents(
-                documents=chunks,
-                embedding=self.embeddings
-                # No persist_directory = in-memory only
-            )
+            self.vector_store = self._build_vector_store(chunks)  # No persist_directory = in-memory only
             logger.info("In-memory database created successfully")
             
             # Only try persistent storage if not in Docker or if explicitly requested
             if not is_docker:
                 try:
-                    if self.persist_directory.exists():
-                        # Remove existing files
-                        for file_path in self.persist_directory.iterdir():
-                            if file_path.is_file():
-                                file_path.unlink()
-                            elif file_path.is_dir():
-                                import shutil
-                                shutil.rmtree(file_path)
+                    self._clear_persist_directory()
                     
                     # Try to create persistent version
                     logger.info("Attempting to create persistent database...")
-                    persistent_store = Chroma.from_documents(
-                        documents=chunks,
-                        embedding=self.embeddings,
-                        persist_directory=str(self.persist_directory)
-                    )
+                    persistent_store = self._build_vector_store(chunks, persist_directory=str(self.persist_directory))
                     
                     # If successful, replace the in-memory version
                     self.vector_store = persistent_store
@@ -161,14 +306,114 @@ class RAGPropertyParser:
             # Last resort: create simple document store
             self._create_simple_database(chunks)
     
+    def _split_documents(self, documents: List[Document]) -> List[Document]:
+        """Split documents into chunks, reusing cached splits for unchanged content"""
+        cache_path = self.persist_directory / SPLITS_CACHE_FILE
+        try:
+            cache = orjson.loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            cache = {}
+        
+        chunks = []
+        used = {}
+        for doc in documents:
+            key = f"{hashlib.sha256(doc.page_content.encode('utf-8')).hexdigest()}_{CHUNK_SIZE}_{CHUNK_OVERLAP}"
+            texts = cache.get(key)
+            if texts is None:
+                texts = self.text_splitter.split_text(doc.page_content)
+            used[key] = texts
+            chunks.extend(Document(page_content=text, metadata=dict(doc.metadata)) for text in texts)
+        
+        # Only keep splits of the current files so the cache doesn't grow forever
+        if used != cache:
+            try:
+                cache_path.write_bytes(orjson.dumps(used))
+            except OSError as e:
+                logger.warning(f"Could not save splitter cache: {e}")
+        
+        return chunks
+    
+    def _merge_chunks(self, chunks: List[Document]) -> List[Document]:
+        """Greedily merge adjacent chunks from the same file so fewer, fuller chunks get embedded"""
+        merged: List[Document] = []
+        for chunk in chunks:
+            previous = merged[-1] if merged else None
+            if previous is None or previous.metadata != chunk.metadata:
+                merged.append(Document(page_content=chunk.page_content, metadata=chunk.metadata))
+                continue
+            
+            # Neighbors share up to CHUNK_OVERLAP characters, only the new text is appended;
+            # past the overlap it still starts with the separator the splitter cut at
+            overlap = self._chunk_overlap(previous.page_content, chunk.page_content)
+            addition = chunk.page_content[overlap:] if overlap else f"\n{chunk.page_content}"
+            if not addition.strip():
+                continue
+            if len(previous.page_content) + len(addition) <= MERGED_CHUNK_SIZE or len(addition) < MIN_CHUNK_SIZE:
+                previous.page_content += addition
+            else:
+                merged.append(Document(page_content=chunk.page_content, metadata=chunk.metadata))
+        return merged
+    
+    @staticmethod
+    def _chunk_overlap(previous: str, following: str) -> int:
+        """Length of the splitter overlap the following chunk starts with, 0 if there is none"""
+        for size in range(min(len(previous), len(following), CHUNK_OVERLAP), 0, -1):
+            if not previous.endswith(following[:size]):
+                continue
+            # The overlap is made of whole splits, a match starting or ending inside a word is a coincidence
+            starts_clean = size == len(previous) or not (previous[-size - 1].isalnum() and following[0].isalnum())
+            ends_clean = size == len(following) or not (following[size - 1].isalnum() and following[size].isalnum())
+            if starts_clean and ends_clean:
+                return size
+        return 0
+    
+    def _build_vector_store(self, chunks: List[Document], persist_directory: str = None) -> Chroma:
+        """Create a Chroma store and insert the chunks in fixed-size batches"""
+        vector_store = Chroma(
+            persist_directory=persist_directory,
+            embedding_function=self.embeddings,
+            collection_metadata=COLLECTION_METADATA
+        )
+        if persist_directory and os.getenv("FAST_INGEST") == "1":
+            self._apply_fast_ingest_pragmas(vector_store)
+        
+        # Chroma has a high fixed cost per add() call, so avoid both tiny and giant inserts
+        batch_size = int(os.getenv("CHROMA_BATCH_SIZE", "200"))
+        for start in range(0, len(chunks), batch_size):
+            vector_store.add_documents(chunks[start:start + batch_size])
+        
+        return vector_store
+    
+    def _apply_fast_ingest_pragmas(self, vector_store: Chroma):
+        """Trade per-insert fsyncs for WAL journaling on Chroma's SQLite database"""
+        # Chroma doesn't expose its SQLite connection, reach in and skip quietly if the layout differs
+        try:
+            client = vector_store._client
+            sysdb = getattr(client, "_sysdb", None) or client._server._sysdb
+            conn = sysdb._conn_pool.connect()
+            for pragma in FAST_INGEST_PRAGMAS:
+                conn.execute(pragma)
+            logger.info("Applied fast ingest SQLite pragmas")
+        except Exception as e:
+            logger.warning(f"Could not apply fast ingest pragmas: {e}")
+    
+    def _clear_persist_directory(self):
+        """Remove the database files but keep the directory and the embedding and splitter caches"""
+        if not self.persist_directory.exists():
+            return
+        for file_path in self.persist_directory.iterdir():
+            if file_path.name in PRESERVED_PERSIST_ENTRIES:
+                continue
+            if file_path.is_file():
+                file_path.unlink()
+            elif file_path.is_dir():
+                shutil.rmtree(file_path)
+    
     def _ensure_directory_writable(self):
         """Ensure the database directory is writable"""
-        # Test write access
-        test_file = self.persist_directory / ".write_test"
-        test_file.write_text("test")
-        test_file.unlink()
-        
-        # If we get here, directory is writable
+        # A single access(2) check instead of writing and deleting a probe file
+        if not os.access(self.persist_directory, os.W_OK):
+            raise PermissionError(f"Vector database directory is not writable: {self.persist_directory}")
     
     def _create_database_alternative(self, chunks):
         """Alternative database creation method"""
@@ -179,11 +424,7 @@ class RAGPropertyParser:
         # Try to create in memory only
         try:
             logger.info("Creating in-memory database using alternative method...")
-            self.vector_store = Chroma.from_documents(
-                documents=chunks,
-                embedding=self.embeddings
-                # No persist_directory = guaranteed in-memory
-            )
+            self.vector_store = self._build_vector_store(chunks)  # No persist_directory = guaranteed in-memory
             logger.info("Alternative in-memory database created successfully")
             
         except Exception as e:
@@ -215,38 +456,63 @@ class RAGPropertyParser:
     def _create_in_memory_database(self, chunks):
         """Create an in-memory database as last resort"""
         # Create in-memory vector store
-        self.vector_store = Chroma.from_documents(
-            documents=chunks,
-            embedding=self.embeddings
-        )
+        self.vector_store = self._build_vector_store(chunks)
         
         logger.warning("Created in-memory database - data will not persist between restarts")
     
     def _collect_documents(self) -> List[Document]:
         """Collect all text documents from the data directory"""
-        documents = []
-        
         # Get all text files from data directory
-        text_files = list(self.data_directory.glob("*.txt"))
-        
-        for file_path in text_files:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-                
-            # Create LangChain Document
-            doc = Document(
-                page_content=content,
-                metadata={
-                    "source": str(file_path),
-                    "filename": file_path.name,
-                    "file_type": "text"
-                }
+        if not self.data_directory.is_dir():
+            return []
+        with os.scandir(self.data_directory) as entries:
+            text_files = sorted(
+                (entry.path, entry.stat().st_mtime)
+                for entry in entries
+                if entry.name.endswith(".txt") and entry.is_file()
             )
-            documents.append(doc)
+        
+        # Read files in parallel; unchanged files are served from the cache
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            documents = list(executor.map(lambda item: self._load_document(*item), text_files))
+        
+        # Forget files that were removed from the data directory
+        current_paths = {path for path, _ in text_files}
+        for path in list(self._document_cache):
+            if path not in current_paths:
+                del self._document_cache[path]
         
         logger.info(f"Collected {len(documents)} documents from data directory")
         return documents
     
+    def _load_document(self, path: str, mtime: float) -> Document:
+        """Load a text file as a LangChain Document, reusing it if the file hasn't changed"""
+        cached = self._document_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        file_path = Path(path)
+        doc = Document(
+            page_content=self._read_text_file(file_path),
+            metadata={
+                "source": path,
+                "filename": file_path.name,
+                "file_type": "text"
+            }
+        )
+        self._document_cache[path] = (mtime, doc)
+        return doc
+    
+    @staticmethod
+    def _read_text_file(file_path: Path) -> str:
+        """Read a UTF-8 file, mapping it into memory only when it is large"""
+        # Setting up a mapping costs more than one read() for typical listing files
+        if file_path.stat().st_size < MMAP_MIN_FILE_SIZE:
+            return file_path.read_text(encoding='utf-8')
+        
+        with open(file_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, 'utf-8')
+    
     def _create_default_document(self) -> Document:
         """Create a default document if no data files are found"""
         default_content = """
@@ -282,7 +548,7 @@ class RAGPropertyParser:
             }
         )
     
-    def query_property_info(self, query: str, k: int = 3) -> List[Dict[str, Any]]:
+    def query_property_info(self, query: str, k: int = 3) -> List[Hit]:
         """
         Query the vector database for relevant property information
         
@@ -295,22 +561,23 @@ class RAGPropertyParser:
         """
         # Try vector store first
         if self.vector_store:
+            key = (query, k)
+            with self._query_cache_lock:
+                cached = self._query_cache.get(key)
+                if cached is not None:
+                    self._query_cache.move_to_end(key)
+                    return list(cached)
+            
             try:
                 # Perform similarity search
-                results = self.vector_store.similarity_search_with_score(query, k=k)
-                
-                # Format results
-                formatted_results = []
-                for doc, score in results:
-                    formatted_results.append({
-                        "content": doc.page_content,
-                        "metadata": doc.metadata,
-                        "relevance_score": float(score),
-                        "source": doc.metadata.get("source", "unknown")
-                    })
+                formatted_results = self._search_by_vector(self.embed_query(query), k)
                 
                 logger.info(f"Retrieved {len(formatted_results)} relevant chunks for query: '{query}'")
-                return formatted_results
+                with self._query_cache_lock:
+                    self._query_cache[key] = formatted_results
+                    if len(self._query_cache) > QUERY_CACHE_SIZE:
+                        self._query_cache.popitem(last=False)
+                return list(formatted_results)
                 
             except Exception as e:
                 logger.warning(f"Vector search failed: {e}, falling back to simple search")
@@ -324,12 +591,8 @@ class RAGPropertyParser:
             for doc in self.documents:
                 content_lower = doc.page_content.lower()
                 if query_lower in content_lower:
-                    relevant_docs.append({
-                        "content": doc.page_content,
-                        "metadata": doc.metadata,
-                        "relevance_score": 0.5,  # Default score for simple search
-                        "source": doc.metadata.get("source", "unknown")
-                    })
+                    # Default score for simple search
+                    relevant_docs.append(Hit(doc.page_content, doc.metadata, 0.5, doc.metadata.get("source", "unknown")))
             
             # Return top k results
             return relevant_docs[:k]
@@ -337,10 +600,127 @@ class RAGPropertyParser:
         logger.error("No search method available")
         return []
     
+    def query_property_info_by_vector(self, embedding: np.ndarray, k: int = 3) -> List[Hit]:
+        """
+        Query the vector database with an embedding the caller already computed
+        
+        Args:
+            embedding: Query embedding from embed_query()
+            k: Number of results to return
+            
+        Returns:
+            List of relevant document chunks with metadata
+        """
+        if not self.vector_store:
+            return []
+        
+        try:
+            return self._search_by_vector(embedding, k)
+        except Exception as e:
+            logger.warning(f"Vector search failed: {e}")
+            return []
+    
+    def _search_by_vector(self, embedding: np.ndarray, k: int) -> List[Hit]:
+        """Run the similarity search for an embedding and format the hits"""
+        if self.memory_index:
+            results = self.memory_index.search(embedding, k=k)
+        else:
+            # Chroma takes plain Python floats
+            results = self.vector_store.similarity_search_by_vector_with_relevance_scores(
+                np.asarray(embedding).tolist(), k=k
+            )
+        
+        return [
+            Hit(doc.page_content, doc.metadata, float(score), doc.metadata.get("source", "unknown"))
+            for doc, score in results
+        ]
+    
+    def embed_query(self, query: str) -> np.ndarray:
+        """Embed a search query, reusing the vectors of the constant internal and recent queries"""
+        vector = self._cached_query_vector(query)
+        if vector is None:
+            # float32 arrays take a quarter of the memory of lists of Python floats,
+            # and the in-memory index searches in float32 without converting them
+            vector = np.asarray(self.embeddings.embed_query(query), dtype=np.float32)
+            self._remember_query_vectors([query], [vector])
+        return vector
+    
+    async def aembed_query(self, query: str) -> np.ndarray:
+        """Embed a search query like embed_query, awaiting the request instead of blocking a thread"""
+        vector = self._cached_query_vector(query)
+        if vector is None:
+            vector = np.asarray(await self.embeddings.underlying_embeddings.aembed_query(query), dtype=np.float32)
+            self._remember_query_vectors([query], [vector])
+        return vector
+    
+    def _cached_query_vector(self, query: str) -> Optional[np.ndarray]:
+        """Get a query embedding computed earlier, if there is one"""
+        if query in CONSTANT_QUERIES:
+            return self._constant_query_vectors.get(query)
+        
+        key = self._query_vector_key(query)
+        with self._query_vectors_lock:
+            vector = self._query_vectors.get(key)
+            if vector is not None:
+                self._query_vectors.move_to_end(key)
+            return vector
+    
+    def _remember_query_vectors(self, queries: List[str], vectors):
+        """Store query embeddings, constant queries are kept outside the LRU"""
+        with self._query_vectors_lock:
+            for query, vector in zip(queries, vectors):
+                if query in CONSTANT_QUERIES:
+                    self._constant_query_vectors[query] = vector
+                else:
+                    self._query_vectors[self._query_vector_key(query)] = vector
+            while len(self._query_vectors) > QUERY_EMBEDDING_CACHE_SIZE:
+                self._query_vectors.popitem(last=False)
+    
+    @staticmethod
+    def _query_vector_key(query: str) -> bytes:
+        """Cache key of a query embedding, whitespace and case variants share one entry"""
+        normalized = " ".join(query.lower().split())
+        return hashlib.blake2b(f"{EMBEDDING_MODEL}\0{normalized}".encode(), digest_size=16).digest()
+    
+    def embed_queries(self, queries: List[str]) -> List[np.ndarray]:
+        """Embed several search queries, sending the ones not cached yet in a single request"""
+        missing = self._uncached_queries(queries)
+        if missing:
+            # The embeddings endpoint takes a list, one round trip covers every new query
+            vectors = np.asarray(self.embeddings.underlying_embeddings.embed_documents(missing), dtype=np.float32)
+            self._remember_query_vectors(missing, vectors)
+        
+        return [self.embed_query(query) for query in queries]
+    
+    async def aembed_queries(self, queries: List[str]) -> List[np.ndarray]:
+        """Embed several search queries like embed_queries, awaiting the request instead of blocking a thread"""
+        missing = self._uncached_queries(queries)
+        if missing:
+            vectors = np.asarray(
+                await self.embeddings.underlying_embeddings.aembed_documents(missing), dtype=np.float32
+            )
+            self._remember_query_vectors(missing, vectors)
+        
+        return [await self.aembed_query(query) for query in queries]
+    
+    def _uncached_queries(self, queries: List[str]) -> List[str]:
+        """Queries without a cached embedding, each normalized query listed once"""
+        missing: Dict[bytes, str] = {}
+        with self._query_vectors_lock:
+            for query in queries:
+                if query in CONSTANT_QUERIES:
+                    if query not in self._constant_query_vectors:
+                        missing[query.encode()] = query
+                    continue
+                key = self._query_vector_key(query)
+                if key not in self._query_vectors:
+                    missing.setdefault(key, query)
+        return list(missing.values())
+    
     def get_property_summary(self) -> str:
         """Get a summary of the property information"""
         # Query for general property information
-        results = self.query_property_info("property name location amenities check-in check-out", k=5)
+        results = self.query_property_info(SUMMARY_QUERY, k=5)
         
         if not results:
             return "Property information not available"
@@ -349,16 +729,17 @@ class RAGPropertyParser:
         summary_parts = []
         
         for result in results:
-            content = result["content"]
+            content = result.content
             # Look for key information patterns
-            if "property" in content.lower() or "name" in content.lower():
-                summary_parts.append(f"🏠 {content.strip()}")
-            elif "location" in content.lower() or "metro" in content.lower():
-                summary_parts.append(f"📍 {content.strip()}")
-            elif "check" in content.lower() and ("pm" in content.lower() or "am" in content.lower()):
-                summary_parts.append(f"⏰ {content.strip()}")
-            elif "wifi" in content.lower() or "amenity" in content.lower():
-                summary_parts.append(f"✨ {content.strip()}")
+            found = set()
+            for match in _SUMMARY_KEYWORD_RE.finditer(content.lower()):
+                found |= _SUMMARY_IMPLIED_KEYWORDS[match.group(1)]
+            for icon, keywords in _SUMMARY_CATEGORIES:
+                if found.intersection(keywords) and (
+                    icon != _SUMMARY_TIME_ICON or found.intersection(_SUMMARY_TIME_KEYWORDS)
+                ):
+                    summary_parts.append(f"{icon} {content.strip()}")
+                    break
         
         if summary_parts:
             return "\n".join(summary_parts[:3])  # Limit to 3 key points
@@ -375,13 +756,18 @@ class RAGPropertyParser:
         Returns:
             Relevant information about the category
         """
-        results = self.query_property_info(category, k=2)
+        key = category.strip().lower()
+        if key in self._specific_info:
+            return self._specific_info[key]
+        
+        results = self.query_property_info(key, k=2)
         
         if not results:
             return f"Information about {category} not found"
         
         # Return the most relevant result
-        return results[0]["content"].strip()
+        self._specific_info[key] = results[0].content.strip()
+        return self._specific_info[key]
     
     def format_for_ai_context(self, query: str = None) -> str:
         """
@@ -399,59 +785,88 @@ class RAGPropertyParser:
             if results:
                 context_parts = [f"Relevant Property Information for '{query}':"]
                 for i, result in enumerate(results, 1):
-                    context_parts.append(f"{i}. {result['content'].strip()}")
+                    context_parts.append(f"{i}. {result.content.strip()}")
                 return "\n\n".join(context_parts)
         
+        if self._general_context is not None:
+            return self._general_context
+        
         # Get general property context
-        results = self.query_property_info("property overview amenities location", k=4)
+        results = self.query_property_info(OVERVIEW_QUERY, k=4)
         
         if not results:
             return "Property information not available"
         
         context_parts = ["Property Information:"]
         for i, result in enumerate(results, 1):
-            context_parts.append(f"{i}. {result['content'].strip()}")
+            context_parts.append(f"{i}. {result.content.strip()}")
         
-        return "\n\n".join(context_parts)
+        self._general_context = "\n\n".join(context_parts)
+        return self._general_context
     
     def refresh_database(self):
         """Refresh the vector database with current data files"""
         logger.info("Refreshing vector database...")
         
         # Remove existing database files but keep the directory
-        if self.persist_directory.exists():
-            # Remove only the database files, not the directory itself
-            for file_path in self.persist_directory.iterdir():
-                if file_path.is_file():
-                    file_path.unlink()
-                elif file_path.is_dir():
-                    import shutil
-                    shutil.rmtree(file_path)
+        self._clear_persist_directory()
         
         # Recreate database
         self._setup_vector_database()
         
+        # Bump the version and drop derived caches only once the new data is in place,
+        # anything computed from the old store during the rebuild stays under the old version
+        self.data_version += 1
+        self._general_context = None
+        self._specific_info.clear()
+        with self._query_cache_lock:
+            self._query_cache.clear()
+        self._database_stats = None
+        
         logger.info("Vector database refreshed successfully")
     
     def get_database_stats(self) -> Dict[str, Any]:
         """Get statistics about the vector database"""
         if not self.vector_store:
             return {"error": "Vector store not initialized"}
+        if self._database_stats is not None:
+            return self._database_stats
         
         # Get collection info
         collection = self.vector_store._collection
         count = collection.count()
         
-        return {
+        self._database_stats = {
             "total_documents": count,
             "data_directory": str(self.data_directory),
             "persist_directory": str(self.persist_directory),
             "embedding_model": "mistral-embed",
-            "chunk_size": 1000,
-            "chunk_overlap": 200,
-            "embedding_provider": "Mistral"
+            "chunk_size": CHUNK_SIZE,
+            "chunk_overlap": CHUNK_OVERLAP,
+            "embedding_provider": "Mistral",
+            "in_memory_index": self.memory_index.get_stats() if self.memory_index else None
         }
+        return self._database_stats
+
+
+# Global instance, built on first use so importing this module stays cheap
+_property_parser: Optional[RAGPropertyParser] = None
+_property_parser_lock = threading.Lock()
+
+
+def get_property_parser() -> RAGPropertyParser:
+    """Get the global property parser, creating it on first call"""
+    global _property_parser
+    if _property_parser is None:
+        # Callers in several threads at once must not each open the vector database
+        with _property_parser_lock:
+            if _property_parser is None:
+                _property_parser = RAGPropertyParser()
+    return _property_parser
 
 
-# Global instance
-property_parser = RAGPropertyParser()
+def __getattr__(name: str):
+    """Keep `from config.listing_parser import property_parser` working"""
+    if name == "property_parser":
+        return get_property_parser()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
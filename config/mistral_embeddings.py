@@ -4,13 +4,20 @@ Uses Mistral AI API for generating embeddings
 """
 
 import os
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Union
 from mistralai.client import MistralClient
+from mistralai.async_client import MistralAsyncClient
 from langchain.embeddings.base import Embeddings
 
 logger = logging.getLogger(__name__)
 
+# Texts sent per embeddings request, bounded by count and by a rough token budget
+EMBED_BATCH_SIZE = 64
+EMBED_BATCH_MAX_TOKENS = 8000
+
 class MistralEmbeddings(Embeddings):
     """Custom Mistral embeddings using Mistral AI API"""
     
@@ -28,7 +35,13 @@ class MistralEmbeddings(Embeddings):
         if not self.api_key:
             raise ValueError("Mistral API key is required. Set MISTRAL_API_KEY environment variable.")
         
-        self.client = MistralClient(api_key=self.api_key)
+        # The client retries rate-limited (429) and failed requests with exponential backoff
+        self.client = MistralClient(api_key=self.api_key, max_retries=int(os.getenv("MISTRAL_MAX_RETRIES", "5")))
+        self.concurrency = int(os.getenv("MISTRAL_EMBED_CONCURRENCY", "8"))
+        
+        # Async client for aembed_*, created lazily for the running event loop
+        self._async_client = None
+        self._async_client_loop = None
         logger.info(f"Mistral embeddings initialized with model: {self.model}")
     
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
@@ -41,19 +54,44 @@ class MistralEmbeddings(Embeddings):
         Returns:
             List of embedding vectors
         """
+        batches = list(self._batch_texts(texts))
         embeddings = []
-        for text in texts:
-            # Generate embedding for single text
-            response = self.client.embeddings(
-                model=self.model,
-                input=text
-            )
-            embedding = response.data[0].embedding
-            embeddings.append(embedding)
+        if len(batches) <= 1 or self.concurrency <= 1:
+            for batch in batches:
+                embeddings.extend(self._embed_batch(batch))
+        else:
+            # Requests are network-bound, keep several in flight; map() preserves input order
+            with ThreadPoolExecutor(max_workers=min(self.concurrency, len(batches))) as executor:
+                for batch_embeddings in executor.map(self._embed_batch, batches):
+                    embeddings.extend(batch_embeddings)
         
-        logger.info(f"Generated embeddings for {len(texts)} documents")
+        logger.info("Generated embeddings for %d documents", len(texts))
         return embeddings
     
+    def _embed_batch(self, batch: List[str]) -> List[List[float]]:
+        """Embed one batch of texts with a single request"""
+        response = self.client.embeddings(
+            model=self.model,
+            input=batch
+        )
+        return [item.embedding for item in response.data]
+    
+    @staticmethod
+    def _batch_texts(texts: List[str]):
+        """Split texts into request-sized batches (about 4 characters per token)"""
+        batch = []
+        batch_tokens = 0
+        for text in texts:
+            tokens = len(text) // 4 + 1
+            if batch and (len(batch) == EMBED_BATCH_SIZE or batch_tokens + tokens > EMBED_BATCH_MAX_TOKENS):
+                yield batch
+                batch = []
+                batch_tokens = 0
+            batch.append(text)
+            batch_tokens += tokens
+        if batch:
+            yield batch
+    
     def embed_query(self, text: str) -> List[float]:
         """
         Embed a single query text using Mistral AI
@@ -69,5 +107,40 @@ class MistralEmbeddings(Embeddings):
             input=text
         )
         embedding = response.data[0].embedding
-        logger.info(f"Generated embedding for query: {text[:50]}...")
+        logger.debug("Generated embedding for a %d-character query", len(text))
         return embedding
+    
+    def _get_async_client(self) -> MistralAsyncClient:
+        """Get the async Mistral client bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            # Reuses one keep-alive connection pool per loop
+            self._async_client = MistralAsyncClient(
+                api_key=self.api_key,
+                max_retries=int(os.getenv("MISTRAL_MAX_RETRIES", "5")),
+                max_concurrent_requests=max(1, self.concurrency)
+            )
+            self._async_client_loop = loop
+        return self._async_client
+    
+    async def _aembed_batch(self, batch: List[str]) -> List[List[float]]:
+        """Embed one batch of texts with a single async request"""
+        response = await self._get_async_client().embeddings(
+            model=self.model,
+            input=batch
+        )
+        return [item.embedding for item in response.data]
+    
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed a list of documents without blocking the event loop"""
+        # The async client caps requests in flight at MISTRAL_EMBED_CONCURRENCY
+        results = await asyncio.gather(*(self._aembed_batch(batch) for batch in self._batch_texts(texts)))
+        embeddings = [embedding for batch_embeddings in results for embedding in batch_embeddings]
+        logger.info("Generated embeddings for %d documents", len(texts))
+        return embeddings
+    
+    async def aembed_query(self, text: str) -> List[float]:
+        """Embed a single query text without blocking the event loop"""
+        embeddings = await self._aembed_batch([text])
+        logger.debug("Generated embedding for a %d-character query", len(text))
+        return embeddings[0]
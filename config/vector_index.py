@@ -0,0 +1,101 @@
+"""
+In-memory Vector Index for the RAG Property Parser
+Brute-force similarity search over a small set of property chunks using numpy
+"""
+
+import logging
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from langchain.schema import Document
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class InMemoryVectorIndex:
+    """Exact nearest-neighbour search over a few thousand embeddings held in one matrix"""
+
+    def __init__(self, documents: List[Document], embeddings: List[List[float]], space: str = "l2",
+                 quantize: bool = False):
+        """
+        Initialize the index
+
+        Args:
+            documents: Chunks in the same order as their embeddings
+            embeddings: Embedding vector for each chunk
+            space: Distance function of the source collection ("l2", "cosine" or "ip")
+            quantize: Store vectors as int8 with a per-vector scale (4x smaller)
+        """
+        self.documents = documents
+        self.space = space
+        self.quantized = quantize
+        matrix = np.asarray(embeddings, dtype=np.float32)
+
+        if space == "cosine":
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix = matrix / np.where(norms == 0, 1, norms)
+        elif space == "l2":
+            self._squared_norms = np.einsum("ij,ij->i", matrix, matrix)
+
+        if quantize:
+            # Symmetric per-vector quantization: v ~= q * scale with q in [-127, 127]
+            max_abs = np.abs(matrix).max(axis=1)
+            self._scales = np.where(max_abs == 0, 1, max_abs / 127).astype(np.float32)
+            self._matrix = np.round(matrix / self._scales[:, None]).astype(np.int8)
+        else:
+            self._matrix = matrix
+
+        logger.info(f"In-memory vector index built with {len(documents)} chunks ({space}, {self._matrix.dtype})")
+
+    @classmethod
+    def from_collection(cls, collection, quantize: bool = False) -> "InMemoryVectorIndex":
+        """Build an index from everything stored in a Chroma collection"""
+        data = collection.get(include=["embeddings", "documents", "metadatas"])
+        documents = [
+            Document(page_content=text, metadata=metadata or {})
+            for text, metadata in zip(data["documents"], data["metadatas"])
+        ]
+        space = (collection.metadata or {}).get("hnsw:space", "l2")
+        return cls(documents, data["embeddings"], space=space, quantize=quantize)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def search(self, query_embedding: List[float], k: int = 3) -> List[Tuple[Document, float]]:
+        """
+        Find the k closest chunks to a query embedding
+
+        Returns:
+            (document, distance) pairs, closest first, with distances on Chroma's scale
+        """
+        if not self.documents or k <= 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if self.quantized:
+            scores = (self._matrix @ query) * self._scales
+        else:
+            scores = self._matrix @ query
+        if self.space == "cosine":
+            norm = np.linalg.norm(query)
+            distances = 1.0 - (scores / norm if norm else scores)
+        elif self.space == "ip":
+            distances = 1.0 - scores
+        else:
+            # Squared euclidean distance, as Chroma reports for its default l2 space
+            distances = self._squared_norms - 2.0 * scores + query @ query
+
+        k = min(k, len(self.documents))
+        nearest = np.argpartition(distances, k - 1)[:k]
+        nearest = nearest[np.argsort(distances[nearest])]
+        return [(self.documents[i], float(distances[i])) for i in nearest]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics"""
+        return {
+            "documents": len(self.documents),
+            "space": self.space,
+            "dtype": str(self._matrix.dtype),
+            "memory_bytes": int(self._matrix.nbytes)
+        }
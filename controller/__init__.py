@@ -4,11 +4,18 @@ Contains core business logic and application controllers
 """
 
 from .a2a_protocol import sms_protocol
-from .ai_response_generator import ai_generator
 from .sms_handler import sms_handler
+from . import ai_response_generator
 
 __all__ = [
     'sms_protocol',
     'ai_generator', 
     'sms_handler'
 ]
+
+
+def __getattr__(name: str):
+    """Resolve ai_generator lazily so importing the package doesn't build it"""
+    if name == "ai_generator":
+        return ai_response_generator.ai_generator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,23 +4,38 @@ Main protocol that orchestrates the entire system using Mistral AI
 """
 
 import os
+import time
 import logging
 import asyncio
-from typing import Dict, Any, Optional, List
+import itertools
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Any, List
 from datetime import datetime
 from dotenv import load_dotenv
 
-from config.listing_parser import property_parser
-from .ai_response_generator import ai_generator
-from .sms_handler import sms_handler
+from config.listing_parser import get_property_parser
+from . import ai_response_generator
+from .sms_handler import sms_handler, normalize_phone_number, load_authorized_numbers
 
 # Load environment variables
 load_dotenv()
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# History entries store a role id, these are the names reported for them
+HISTORY_ROLES = ("guest", "host_ai")
+GUEST_ROLE, HOST_AI_ROLE = range(len(HISTORY_ROLES))
+
+
+@dataclass(slots=True)
+class Turn:
+    """One conversation history entry"""
+    ts_ns: int
+    role: int
+    text: str
+
 
 class SMSHostProtocol:
     """
@@ -37,12 +52,33 @@ class SMSHostProtocol:
     def __init__(self):
         self.protocol_id = os.getenv("A2A_PROTOCOL_ID", "sms-host-protocol")
         self.agent_id = os.getenv("A2A_AGENT_ID", "sms-host-agent")
+        # Configuration read once instead of on every message
+        self._guest_phone = os.getenv("GUEST_PHONE_NUMBER")
+        self._authorized_numbers = load_authorized_numbers()
+        self._ai_model_name = os.getenv("MISTRAL_MODEL", "mistral-large-latest")
         self.is_running = False
         self.start_time = None
+        self._start_monotonic = None
         self.message_count = 0
-        self.conversation_history = []
+        # Bounded history: the oldest entries are evicted in O(1) once full. Kept even
+        # so that guest/host_ai pairs are always trimmed together
+        max_messages = int(os.getenv("HISTORY_MAX_MESSAGES", "200"))
+        # Compact Turn records, formatted only when history is read
+        self.conversation_history = deque(maxlen=max(2, max_messages - max_messages % 2))
+        
+        # Set (and replaced) whenever a message has been processed, see wait_for_update()
+        self._update_event = asyncio.Event()
+        
+        # Status fields fixed at construction, get_protocol_status() only adds the live ones
+        self._static_status = {
+            "protocol_id": self.protocol_id,
+            "agent_id": self.agent_id,
+            "ai_model": self._ai_model_name,
+            "ai_provider": "Mistral AI",
+            "rag_architecture": "Enabled"
+        }
         
-        logger.info(f"SMS Host Protocol initialized: {self.protocol_id}")
+        logger.info("SMS Host Protocol initialized: %s", self.protocol_id)
 
     async def start(self) -> bool:
         """Start the A2A protocol"""
@@ -58,14 +94,18 @@ class SMSHostProtocol:
             logger.error("Protocol component initialization failed.")
             return False
         
+        # Chat requests from concurrent messages are micro-batched from the first one on
+        ai_response_generator.ai_generator.start()
+        
         self.is_running = True
         self.start_time = datetime.now()
+        self._start_monotonic = time.monotonic()
         
         logger.info("SMS Host Protocol started successfully")
-        logger.info(f"Protocol ID: {self.protocol_id}")
-        logger.info(f"Agent ID: {self.agent_id}")
-        logger.info(f"Guest Phone: {os.getenv('GUEST_PHONE_NUMBER')}")
-        logger.info(f"AI Model: {os.getenv('MISTRAL_MODEL', 'mistral-large-latest')}")
+        logger.info("Protocol ID: %s", self.protocol_id)
+        logger.info("Agent ID: %s", self.agent_id)
+        logger.info("Guest Phone: %s", self._guest_phone)
+        logger.info("AI Model: %s", self._ai_model_name)
         logger.info("RAG Architecture: Enabled with vector database")
         
         return True
@@ -75,6 +115,8 @@ class SMSHostProtocol:
         logger.info("Stopping SMS Host Protocol...")
         
         self.is_running = False
+        await ai_response_generator.ai_generator.close()
+        sms_handler.close()
         
         logger.info("SMS Host Protocol stopped successfully")
 
@@ -90,108 +132,134 @@ class SMSHostProtocol:
         
         for var in required_vars:
             if not os.getenv(var):
-                logger.error(f"Missing required environment variable: {var}")
+                logger.error("Missing required environment variable: %s", var)
                 return False
         return True
 
     async def _initialize_components(self) -> bool:
         """Initialize all protocol components"""
-        # Test RAG property parser
-        rag_stats = property_parser.get_database_stats()
-        logger.info(f"RAG Property Parser initialized: {rag_stats}")
-        
-        # Test AI generator (initialization only)
-        ai_generator # Accessing the global instance to ensure it's initialized
-        
-        # Test SMS handler (initialization only)
-        sms_handler # Accessing the global instance to ensure it's initialized
+        # Bring up the RAG parser, AI generator and SMS handler concurrently,
+        # startup then takes as long as the slowest component
+        rag_stats, _, sms_status = await asyncio.gather(
+            asyncio.to_thread(lambda: get_property_parser().get_database_stats()),
+            asyncio.to_thread(lambda: ai_response_generator.ai_generator),
+            asyncio.to_thread(sms_handler.get_sms_status)
+        )
+        logger.info("RAG Property Parser initialized: %s", rag_stats)
+        logger.info("SMS Handler status: %s", sms_status['status'])
         
         logger.info("All protocol components initialized successfully.")
         return True
 
-    def process_guest_message(self, message: str, from_number: str = None) -> str:
+    async def process_guest_message(self, message: str, from_number: str = None) -> str:
         """Process an incoming guest message and generate a response using RAG"""
         if not self.is_running:
             logger.warning("Protocol not running, cannot process message")
             return "System is currently offline. Please try again later."
         
         # Validate sender if from_number is provided
-        if from_number and from_number != os.getenv("GUEST_PHONE_NUMBER"):
-            logger.warning(f"Unauthorized message from {from_number}")
+        if from_number and normalize_phone_number(from_number) not in self._authorized_numbers:
+            logger.warning("Unauthorized message from %s", from_number)
             return "Sorry, this number is not authorized to receive responses from this property."
         
         # Generate AI response using RAG
         guest_name = "Guest" # Default guest name
-        response_text = ai_generator.generate_response(message, guest_name)
+        response_text = await ai_response_generator.ai_generator.generate_response(message, guest_name)
         
         # Update conversation history
-        self.conversation_history.append({
-            "timestamp": datetime.now().isoformat(),
-            "role": "guest",
-            "message": message
-        })
-        self.conversation_history.append({
-            "timestamp": datetime.now().isoformat(),
-            "role": "host_ai",
-            "message": response_text
-        })
+        self._append_turn(message, response_text)
         self.message_count += 1
+        self._notify_update()
         
         # If from_number is provided, send SMS response
         if from_number:
-            sms_handler._send_sms_response(from_number, response_text) # Direct call to send SMS
+            await sms_handler.send_sms(from_number, response_text)
         
-        logger.info(f"Message processed using RAG. Response: {response_text}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Message processed using RAG. Response: %s", response_text)
         return response_text
 
-    def send_welcome_message(self):
+    def _notify_update(self):
+        """Wake everything waiting for the next processed message"""
+        event, self._update_event = self._update_event, asyncio.Event()
+        event.set()
+
+    async def wait_for_update(self):
+        """Wait until another message has been processed"""
+        await self._update_event.wait()
+
+    def _append_turn(self, guest_message: str, response_text: str):
+        """Append a guest message and its reply together, evicting the oldest pair when full"""
+        # No await in between, so concurrent handlers can't interleave the pair
+        if len(self.conversation_history) == self.conversation_history.maxlen:
+            logger.debug("Conversation history full, trimming the oldest turn")
+        self.conversation_history.append(Turn(time.time_ns(), GUEST_ROLE, guest_message))
+        self.conversation_history.append(Turn(time.time_ns(), HOST_AI_ROLE, response_text))
+
+    async def process_guest_messages(self, messages: List[str], from_number: str = None) -> List[str]:
+        """Process several guest messages concurrently so their LLM calls overlap"""
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(self.process_guest_message(m, from_number)) for m in messages]
+        return [task.result() for task in tasks]
+
+    async def send_welcome_message(self):
         """Send a welcome message to the guest"""
         if not self.is_running:
             logger.warning("Protocol not running, cannot send welcome message")
             return False
         
-        sms_handler.send_welcome_message()
+        await sms_handler.send_welcome_message()
         logger.info("Welcome message sent successfully")
         return True
 
-    def send_property_summary(self):
+    async def send_property_summary(self):
         """Send a property summary to the guest using RAG"""
         if not self.is_running:
             logger.warning("Protocol not running, cannot send property summary")
             return False
         
-        sms_handler.send_property_summary()
+        await sms_handler.send_property_summary()
         logger.info("Property summary sent successfully using RAG")
         return True
 
     def get_protocol_status(self) -> Dict[str, Any]:
         """Get the current status of the protocol"""
         uptime_seconds = None
-        if self.is_running and self.start_time:
-            uptime_seconds = (datetime.now() - self.start_time).total_seconds()
+        if self.is_running and self._start_monotonic is not None:
+            # Monotonic clock, so wall-clock adjustments don't skew the uptime
+            uptime_seconds = time.monotonic() - self._start_monotonic
         
         # Get RAG statistics
-        rag_stats = property_parser.get_database_stats()
+        rag_stats = get_property_parser().get_database_stats()
         
         return {
-            "protocol_id": self.protocol_id,
-            "agent_id": self.agent_id,
+            **self._static_status,
             "status": "Running" if self.is_running else "Stopped",
             "start_time": self.start_time.isoformat() if self.start_time else None,
             "uptime_seconds": uptime_seconds,
             "total_messages": self.message_count,
             "conversation_history_count": len(self.conversation_history),
-            "ai_model": os.getenv("MISTRAL_MODEL", "mistral-large-latest"),
-            "ai_provider": "Mistral AI",
-            "rag_architecture": "Enabled",
             "rag_stats": rag_stats
         }
 
     def get_conversation_history(self, limit: int = 10) -> List[Dict[str, str]]:
         """Get recent conversation history"""
-        return self.conversation_history[-limit:]
+        start = max(0, len(self.conversation_history) - limit)
+        return [
+            {
+                "timestamp": datetime.fromtimestamp(turn.ts_ns / 1e9).isoformat(),
+                "role": HISTORY_ROLES[turn.role],
+                "message": turn.text
+            }
+            for turn in itertools.islice(self.conversation_history, start, None)
+        ]
+
+    def _run_rag_tests(self, query: str):
+        """Get RAG database stats and run a sample query (blocking)"""
+        parser = get_property_parser()
+        return parser.get_database_stats(), parser.query_property_info(query, k=2)
 
-    def test_protocol(self) -> Dict[str, Any]:
+    async def test_protocol(self) -> Dict[str, Any]:
         """Run internal tests for the protocol components"""
         test_results = {
             "protocol_status": self.get_protocol_status(),
@@ -200,26 +268,23 @@ class SMSHostProtocol:
             "rag_tests": {}
         }
         
-        # Test RAG property parser
-        rag_stats = property_parser.get_database_stats()
-        test_results["rag_tests"]["database_stats"] = rag_stats
-        
-        # Test RAG query
+        # Test RAG property parser and query in a worker thread while the AI generator runs
         test_query = "WiFi amenities"
-        rag_results = property_parser.query_property_info(test_query, k=2)
+        (rag_stats, rag_results), ai_test_responses = await asyncio.gather(
+            asyncio.to_thread(self._run_rag_tests, test_query),
+            ai_response_generator.ai_generator.test_response_generation()
+        )
+        test_results["rag_tests"]["database_stats"] = rag_stats
         test_results["rag_tests"]["query_test"] = {
             "query": test_query,
             "results_count": len(rag_results),
-            "sample_result": rag_results[0] if rag_results else None
+            "sample_result": rag_results[0]._asdict() if rag_results else None
         }
-        
-        # Test AI generator
-        ai_test_responses = ai_generator.test_response_generation()
         test_results["components"]["ai_generator"] = ai_test_responses
         
         # Test message processing (without actual SMS sending)
         test_message = "What are the check-in times?"
-        simulated_response = self.process_guest_message(test_message, from_number=os.getenv("GUEST_PHONE_NUMBER"))
+        simulated_response = await self.process_guest_message(test_message, from_number=self._guest_phone)
         test_results["messages"].append({
             "test_message": test_message,
             "simulated_response": simulated_response
@@ -235,7 +300,8 @@ class SMSHostProtocol:
             return False
         
         logger.info("Refreshing RAG vector database...")
-        property_parser.refresh_database()
+        get_property_parser().refresh_database()
+        ai_response_generator.ai_generator.clear_response_cache()
         logger.info("RAG vector database refreshed successfully")
         return True
 
@@ -245,17 +311,17 @@ class SMSHostProtocol:
             return {"error": "Protocol not running"}
         
         # Get relevant context
-        results = property_parser.query_property_info(query, k=3)
+        results = get_property_parser().query_property_info(query, k=3)
         
         # Get AI response for context
-        context = property_parser.format_for_ai_context(query)
+        context = get_property_parser().format_for_ai_context(query)
         
         return {
             "query": query,
             "relevant_chunks": len(results),
             "context": context,
-            "top_result": results[0] if results else None,
-            "all_results": results
+            "top_result": results[0]._asdict() if results else None,
+            "all_results": [result._asdict() for result in results]
         }
 
 # Global protocol instance
@@ -4,145 +4,427 @@ Uses Mistral Large LLM to generate casual and friendly responses
 """
 
 import os
+import re
+import hashlib
 import logging
-from typing import Dict, Any, Optional
-from mistralai.client import MistralClient
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List
+import numpy as np
+from mistralai.async_client import MistralAsyncClient
 from mistralai.models.chat_completion import ChatMessage
-from config.listing_parser import property_parser
+from config.listing_parser import get_property_parser
+from .response_cache import SemanticResponseCache, GUEST_NAME_PLACEHOLDER
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Matches a reply wrapped in a markdown code fence or in quotes, compiled once at import
+_WRAPPED_RESPONSE_RE = re.compile(r'^(?:```[a-zA-Z]*\s*(?P<fenced>.*?)\s*```|"(?P<double>.*)"|\'(?P<single>.*)\')$', re.DOTALL)
+
+# Greetings and acknowledgements that need neither RAG nor the LLM
+_TRIVIAL_MESSAGE_RE = re.compile(r'^\s*(?:(?:hi|hey|hello|thanks|thank you|thx|ok|okay|👍|👋)[\s.,!?]*)*$', re.IGNORECASE)
+_TRIVIAL_REPLY = "Hey {name}! 👋 Let me know if you have any questions about your stay!"
+
+# Collapses whitespace runs when normalizing messages for the exact-match cache
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# SMS clients don't render markdown emphasis, drop it in a single pass
+_MARKDOWN_EMPHASIS_TABLE = str.maketrans("", "", "*")
+
+# Extra characters streamed past the SMS budget, covering quotes or code fences that cleanup strips
+_STREAM_BUDGET_SLACK = 8
+
+# Fallback reply topics, one named group each; the lookahead reports every
+# topic mentioned (even overlapping ones), which are answered in priority order
+_FALLBACK_TOPIC_RE = re.compile(
+    r'(?=(?P<checkin>check-?in)|(?P<checkout>check-?out)|(?P<wifi>wifi)|(?P<parking>parking)'
+    r'|(?P<pet>pet|dog|cat)|(?P<rule>rule)|(?P<nearby>nearby|restaurant)|(?P<cancel>cancel|refund))',
+    re.IGNORECASE
+)
+_FALLBACK_PRIORITY = ("checkin", "checkout", "wifi", "parking", "pet", "rule", "nearby", "cancel")
+_FALLBACK_REPLIES = {
+    "checkin": "Hey {name}! Check-in is usually at 3:00 PM. I'll send you the exact details closer to your arrival! ⏰",
+    "checkout": "Hey {name}! Check-out is usually at 11:00 AM. Let me know if you need anything else! 👋",
+    "wifi": "Hey {name}! Yes, we have free high-speed WiFi available! The network name and password will be provided upon check-in. 📶",
+    "parking": "Hey {name}! Yes, we have free parking available right at the property. 🚗",
+    "pet": "Hey {name}! Unfortunately, we have a strict no-pets policy at the property. Thanks for understanding! 🚫🐾",
+    "rule": "Hey {name}! Our main house rules are no smoking, no pets, and quiet hours from 10 PM to 8 AM. Full details are in the property guide! 🏡",
+    "nearby": "Hey {name}! We're close to restaurants, shopping centers, and attractions. I'll send you my local favorites! 🗺️",
+    "cancel": "Hey {name}! Our cancellation policy is flexible: full refund if cancelled 7+ days before arrival, 50% within 7 days. Please check your booking details for specifics. 🗓️",
+    "default": "Hey {name}! Thanks for your message! I'd be happy to help with any questions about your stay. What would you like to know? 😊",
+}
+
+# Static system prompt, kept byte-identical across requests so provider-side
+# prompt prefix caching can be reused; per-message content goes in the user turn
+SYSTEM_PROMPT = """You are a friendly and helpful property host assistant. You're responding to guest SMS messages about a property.
+
+Your communication style should be:
+- Casual and friendly (not formal)
+- Warm and welcoming
+- Helpful and informative
+- Concise (SMS length)
+- Use emojis occasionally to keep it friendly
+- Be enthusiastic about the property
+
+Always base your responses on the actual property information provided in the context. If you don't know something specific, say so and offer to help find out.
+
+Keep responses under 160 characters when possible for SMS."""
+
 class AIResponseGenerator:
     """Generates AI-powered responses to guest SMS messages using Mistral Large with RAG"""
     
     def __init__(self):
-        self.client = MistralClient(api_key=os.getenv("MISTRAL_API_KEY"))
+        self.api_key = os.getenv("MISTRAL_API_KEY")
         self.model = os.getenv("MISTRAL_MODEL", "mistral-large-latest")
+        # Hard limit on how long a guest waits for the AI before getting a fallback reply
+        self.timeout = float(os.getenv("MISTRAL_TIMEOUT", "10"))
+        
+        # The system message never changes, build it once
+        self._system_message = ChatMessage(role="system", content=self._get_system_prompt())
+        
+        # Exact-match cache for verbatim repeats (retries, duplicate webhooks), checked
+        # first, and a semantic cache so near-duplicate questions skip the Mistral round-trip
+        self.exact_cache = None
+        self.exact_cache_size = 2048
+        # clear_response_cache() runs in a worker thread during a database refresh
+        self._exact_cache_lock = threading.Lock()
+        self.response_cache = None
+        if os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true":
+            self.exact_cache = OrderedDict()
+            self.response_cache = SemanticResponseCache(
+                data_version_fn=lambda: get_property_parser().data_fingerprint,
+                db_path=os.getenv("RESPONSE_CACHE_PATH"),
+                threshold=float(os.getenv("RESPONSE_CACHE_THRESHOLD", "0.95")),
+                max_entries=int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "10000"))
+            )
+        
+        # Async Mistral client, created lazily for the running event loop
+        self._client = None
+        self._client_loop = None
+        
+        # Micro-batching of outbound chat requests
+        self.batch_max = int(os.getenv("BATCH_MAX", "8"))
+        self.batch_window = int(os.getenv("BATCH_WINDOW_MS", "50")) / 1000
+        self._batch_queue = None
+        self._batch_worker = None
+        self._batch_tasks = set()
+        
+        # Property summary as (data version, text), rebuilt after the RAG database is refreshed
+        self._property_summary = None
+        
+        # SMS length budget: GSM-7 fits 160 chars (153 per part once concatenated),
+        # a single non-GSM character switches the message to UCS-2 at 70 (67 per part)
+        sms_segments = int(os.getenv("SMS_MAX_SEGMENTS", "2"))
+        self.gsm_max_chars = 160 if sms_segments == 1 else 153 * sms_segments
+        self.ucs2_max_units = 70 if sms_segments == 1 else 67 * sms_segments
         
         logger.info(f"AI Response Generator initialized with model: {self.model}")
 
-    def generate_response(self, guest_message: str, guest_name: str = "Guest") -> str:
+    def _get_client(self) -> MistralAsyncClient:
+        """Get the async Mistral client bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            # The client's connection pool is tied to the loop it was created on
+            self._client = MistralAsyncClient(api_key=self.api_key)
+            self._client_loop = loop
+        return self._client
+
+    def start(self):
+        """Start the batch worker ahead of the first message (call from the serving event loop)"""
+        self._ensure_batch_worker()
+
+    async def close(self):
+        """Stop the batch worker and close the Mistral client connection pool"""
+        if self._batch_worker is not None and self._batch_worker.get_loop() is asyncio.get_running_loop():
+            self._batch_worker.cancel()
+            # Requests still queued would otherwise wait for a worker that no longer exists
+            while not self._batch_queue.empty():
+                _, future = self._batch_queue.get_nowait()
+                future.set_exception(RuntimeError("AI response generator was closed"))
+        self._batch_worker = None
+        self._batch_queue = None
+        
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client.close()
+        self._client = None
+        self._client_loop = None
+
+    def _ensure_batch_worker(self):
+        """Start the batch worker on the running event loop if needed"""
+        loop = asyncio.get_running_loop()
+        if self._batch_worker is None or self._batch_worker.done() or self._batch_worker.get_loop() is not loop:
+            self._batch_queue = asyncio.Queue()
+            self._batch_worker = loop.create_task(self._batch_loop())
+
+    async def _chat(self, messages: List[ChatMessage]) -> str:
+        """Queue a chat request for the batch worker and wait for its completion"""
+        self._ensure_batch_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._batch_queue.put((messages, future))
+        return await future
+
+    async def _batch_loop(self):
+        """Collect chat requests arriving within a short window and dispatch them together"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._batch_queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.batch_max:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._batch_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Dispatch without waiting so a slow batch doesn't hold up the next one
+            task = loop.create_task(self._dispatch_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _dispatch_batch(self, batch: List[tuple]):
+        """Run a batch of chat requests concurrently and resolve each caller's future"""
+        logger.debug("Dispatching batch of %d chat requests", len(batch))
+        results = await asyncio.gather(
+            *(self._complete(messages) for messages, _ in batch),
+            return_exceptions=True
+        )
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _complete(self, messages: List[ChatMessage]) -> str:
+        """Stream a chat completion from Mistral, stopping once the SMS budget is full"""
+        stream = self._get_client().chat_stream(
+            model=self.model,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=200
+        )
+        parts = []
+        # Length as _clean_response measures it: UTF-16 code units, without the stripped emphasis marks
+        length = 0
+        ascii_only = True
+        try:
+            async for chunk in stream:
+                content = chunk.choices[0].delta.content
+                if not content:
+                    continue
+                parts.append(content)
+                if content.isascii():
+                    length += len(content) - content.count("*")
+                else:
+                    ascii_only = False
+                    length += len(content.encode("utf-16-le")) // 2 - content.count("*")
+                # Anything past the budget would be truncated by _clean_response anyway
+                budget = self.gsm_max_chars if ascii_only else self.ucs2_max_units
+                if length > budget + _STREAM_BUDGET_SLACK:
+                    break
+        finally:
+            # Closing the stream early cancels the rest of the generation
+            await stream.aclose()
+        return "".join(parts)
+
+    async def generate_response(self, guest_message: str, guest_name: str = "Guest") -> str:
         """Generate an AI response based on guest message and RAG-retrieved property context"""
-        logger.info(f"Generating AI response for message: '{guest_message}' from {guest_name}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Generating AI response for message: %r from %s", guest_message, guest_name)
+        
+        # Small talk gets a canned reply without touching the vector database or Mistral
+        if _TRIVIAL_MESSAGE_RE.match(guest_message):
+            return _TRIVIAL_REPLY.format(name=guest_name)
         
-        # Get relevant property context using RAG
-        property_context = self._get_relevant_context(guest_message)
+        # Check the exact-match and semantic caches before doing any retrieval or generation
+        exact_key = None
+        if self.exact_cache is not None:
+            exact_key = self._exact_cache_key(guest_message)
+            cached_response = self._lookup_exact(exact_key)
+            if cached_response is not None:
+                return cached_response.replace(GUEST_NAME_PLACEHOLDER, guest_name)
+        
+        # Embed the message once; the same vector probes the cache and drives the RAG search
+        query_embedding = None
+        message_embedding = None
+        if self.response_cache:
+            query_embedding = await get_property_parser().aembed_query(guest_message.strip())
+            message_embedding = self.response_cache.normalize(query_embedding)
+            # The first lookup after a data change reloads the cache from SQLite
+            cached_response = await asyncio.to_thread(self.response_cache.lookup, message_embedding)
+            if cached_response is not None:
+                self._remember_exact(exact_key, cached_response)
+                return cached_response.replace(GUEST_NAME_PLACEHOLDER, guest_name)
+        
+        # The reply is only cached if the data doesn't change before it is stored
+        data_version = get_property_parser().data_fingerprint
+        
+        # Get relevant property context using RAG (vector search is blocking)
+        property_context = await asyncio.to_thread(self._get_relevant_context, guest_message, query_embedding)
         
         # Build the prompt for Mistral
         prompt = self._build_prompt(guest_message, guest_name, property_context)
         
         # Generate response using Mistral
         messages = [
-            ChatMessage(role="system", content=self._get_system_prompt()),
+            self._system_message,
             ChatMessage(role="user", content=prompt)
         ]
         
-        response = self.client.chat(
-            model=self.model,
-            messages=messages,
-            temperature=0.7,
-            max_tokens=200
-        )
+        try:
+            ai_text = await asyncio.wait_for(self._chat(messages), self.timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Mistral response timed out after %.1fs, using fallback reply", self.timeout)
+            return self._generate_fallback_response(guest_message, guest_name)
         
-        ai_text = response.choices[0].message.content
         cleaned_response = self._clean_response(ai_text)
-        logger.info(f"AI generated response: '{cleaned_response}'")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("AI generated response: %r", cleaned_response)
+        
+        # Store with the guest name stripped so the reply can be reused for anyone
+        if self.response_cache:
+            # The generic "Guest" isn't templated, it also appears in phrases like "Guest WiFi";
+            # a real name is only replaced as a whole word, so "Ann" leaves "Anniversary" alone
+            if guest_name and guest_name != "Guest":
+                name_re = re.compile(rf"(?<!\w){re.escape(guest_name)}(?!\w)")
+                template = name_re.sub(lambda _: GUEST_NAME_PLACEHOLDER, cleaned_response)
+            else:
+                template = cleaned_response
+            self._remember_exact(exact_key, template)
+            await asyncio.to_thread(
+                self.response_cache.add, guest_message, message_embedding, template, data_version
+            )
+        
         return cleaned_response
 
-    def _get_relevant_context(self, guest_message: str) -> str:
-        """Get relevant property context using RAG"""
+    async def generate_responses(self, guest_messages: List[str], guest_name: str = "Guest") -> List[str]:
+        """Generate responses for several messages, embedding all of them with one request"""
+        to_embed = [message for message in guest_messages if not _TRIVIAL_MESSAGE_RE.match(message)]
+        if to_embed:
+            # Fills the parser's query embedding cache, generate_response then reuses the vectors
+            await get_property_parser().aembed_queries(to_embed)
+        
+        # Chat requests from the concurrent generations are micro-batched by the batch worker
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(self.generate_response(message, guest_name)) for message in guest_messages]
+        return [task.result() for task in tasks]
+
+    def _exact_cache_key(self, guest_message: str) -> bytes:
+        """Key a message by its normalized text and the property data version"""
+        normalized = _WHITESPACE_RE.sub(" ", guest_message.strip().lower())
+        version = get_property_parser().data_version
+        return hashlib.blake2b(f"{version}\0{normalized}".encode("utf-8"), digest_size=16).digest()
+
+    def _lookup_exact(self, key: bytes) -> Optional[str]:
+        """Get a response template from the exact-match LRU"""
+        with self._exact_cache_lock:
+            template = self.exact_cache.get(key)
+            if template is not None:
+                self.exact_cache.move_to_end(key)
+            return template
+
+    def _remember_exact(self, key: Optional[bytes], template: str):
+        """Store a response template in the exact-match LRU"""
+        if key is None:
+            return
+        with self._exact_cache_lock:
+            self.exact_cache[key] = template
+            self.exact_cache.move_to_end(key)
+            if len(self.exact_cache) > self.exact_cache_size:
+                self.exact_cache.popitem(last=False)
+
+    def _get_relevant_context(self, guest_message: str, query_embedding: Optional[np.ndarray] = None) -> str:
+        """Get relevant property context using RAG, reusing the message embedding if there is one"""
         # Use RAG to get context specific to the guest's question
-        results = property_parser.query_property_info(guest_message, k=3)
+        if query_embedding is not None:
+            results = get_property_parser().query_property_info_by_vector(query_embedding, k=3)
+        else:
+            results = get_property_parser().query_property_info(guest_message, k=3)
         
         if not results:
             logger.warning("No relevant context found for query, using general context")
-            return property_parser.format_for_ai_context()
+            return get_property_parser().format_for_ai_context()
         
         # Format the most relevant results
         context_parts = ["Relevant Property Information:"]
         for i, result in enumerate(results[:2], 1):  # Use top 2 results
-            context_parts.append(f"{i}. {result['content'].strip()}")
+            context_parts.append(f"{i}. {result.content.strip()}")
         
         return "\n\n".join(context_parts)
 
     def _get_system_prompt(self) -> str:
         """Get the system prompt for Mistral"""
-        return """You are a friendly and helpful property host assistant. You're responding to guest SMS messages about a property.
-
-Your communication style should be:
-- Casual and friendly (not formal)
-- Warm and welcoming
-- Helpful and informative
-- Concise (SMS length)
-- Use emojis occasionally to keep it friendly
-- Be enthusiastic about the property
-
-Always base your responses on the actual property information provided in the context. If you don't know something specific, say so and offer to help find out.
-
-Keep responses under 160 characters when possible for SMS."""
+        return SYSTEM_PROMPT
 
     def _build_prompt(self, guest_message: str, guest_name: str, property_context: str) -> str:
-        """Build the user prompt for Mistral"""
-        return f"""Guest message: "{guest_message}"
+        """
+        Build the user prompt for Mistral
+        
+        Static instructions come first and the guest message last, so the
+        request shares the longest possible prefix with previous requests.
+        """
+        return f"""Based on the property information below, provide a casual and friendly response to the guest.
 
 Property Context:
 {property_context}
 
-Based on the property information above, provide a casual and friendly response to {guest_name}.
+Guest name: {guest_name}
+Guest message: "{guest_message}"
 """
 
     def _clean_response(self, response: str) -> str:
         """Clean the AI response for SMS"""
         # Remove leading/trailing quotes or markdown code blocks
-        response = response.strip()
-        if response.startswith(('"', "'", "```")) and response.endswith(('"', "'", "```")):
-            response = response[1:-1].strip()
-            if response.startswith("python"): # Remove language tag from markdown
-                response = response[6:].strip()
+        if response and (response[0].isspace() or response[-1].isspace()):
+            response = response.strip()
+        match = _WRAPPED_RESPONSE_RE.match(response)
+        if match:
+            response = next(group for group in match.groups() if group is not None).strip()
+        response = response.translate(_MARKDOWN_EMPHASIS_TABLE)
         
-        # Truncate for SMS length if necessary (common SMS limit is 160 characters)
-        if len(response) > 320: # Allow a bit more for multi-part SMS, but keep it concise
-            response = response[:317] + "..."
+        # Truncate to the SMS segment budget (ASCII is used as a proxy for GSM-7)
+        if response.isascii():
+            if len(response) > self.gsm_max_chars:
+                response = response[:self.gsm_max_chars - 3] + "..."
+        else:
+            # UCS-2 is counted in UTF-16 code units, emoji take two of them
+            encoded = response.encode("utf-16-le")
+            if len(encoded) > 2 * self.ucs2_max_units:
+                # Cutting through a surrogate pair leaves half an emoji, which "ignore" drops
+                response = encoded[:2 * (self.ucs2_max_units - 1)].decode("utf-16-le", "ignore") + "…"
         
         return response
 
     def _generate_fallback_response(self, guest_message: str, guest_name: str) -> str:
         """Generate fallback response if AI generation fails"""
-        message_lower = guest_message.lower()
-        
-        if "checkin" in message_lower or "check-in" in message_lower:
-            return f"Hey {guest_name}! Check-in is usually at 3:00 PM. I'll send you the exact details closer to your arrival! ⏰"
+        # Single pass over the message collects every topic it mentions
+        topics = {m.lastgroup for m in _FALLBACK_TOPIC_RE.finditer(guest_message)}
         
-        elif "checkout" in message_lower or "check-out" in message_lower:
-            return f"Hey {guest_name}! Check-out is usually at 11:00 AM. Let me know if you need anything else! 👋"
+        for topic in _FALLBACK_PRIORITY:
+            if topic in topics:
+                return _FALLBACK_REPLIES[topic].format(name=guest_name)
         
-        elif "wifi" in message_lower:
-            return f"Hey {guest_name}! Yes, we have free high-speed WiFi available! The network name and password will be provided upon check-in. 📶"
-        
-        elif "parking" in message_lower:
-            return f"Hey {guest_name}! Yes, we have free parking available right at the property. 🚗"
-        
-        elif "pet" in message_lower or "dog" in message_lower or "cat" in message_lower:
-            return f"Hey {guest_name}! Unfortunately, we have a strict no-pets policy at the property. Thanks for understanding! 🚫🐾"
-        
-        elif "rule" in message_lower:
-            return f"Hey {guest_name}! Our main house rules are no smoking, no pets, and quiet hours from 10 PM to 8 AM. Full details are in the property guide! 🏡"
-        
-        elif "nearby" in message_lower or "restaurant" in message_lower:
-            return f"Hey {guest_name}! We're close to restaurants, shopping centers, and attractions. I'll send you my local favorites! 🗺️"
-        
-        elif "cancel" in message_lower or "refund" in message_lower:
-            return f"Hey {guest_name}! Our cancellation policy is flexible: full refund if cancelled 7+ days before arrival, 50% within 7 days. Please check your booking details for specifics. 🗓️"
-        
-        else:
-            return f"Hey {guest_name}! Thanks for your message! I'd be happy to help with any questions about your stay. What would you like to know? 😊"
+        return _FALLBACK_REPLIES["default"].format(name=guest_name)
 
     def get_property_summary(self) -> str:
         """Get a summary of the property for quick reference"""
-        return property_parser.get_property_summary()
+        parser = get_property_parser()
+        cached = self._property_summary
+        if cached is not None and cached[0] == parser.data_version:
+            return cached[1]
+        # Read the version first: refresh_database bumps it after the rebuild, so a summary
+        # computed from the old store during a refresh is never cached under the new version
+        version = parser.data_version
+        summary = parser.get_property_summary()
+        self._property_summary = (version, summary)
+        return summary
 
-    def test_response_generation(self) -> Dict[str, str]:
+    async def test_response_generation(self) -> Dict[str, str]:
         """Test AI response generation with sample questions"""
         test_questions = [
             "Do you have WiFi?",
@@ -150,15 +432,35 @@ Based on the property information above, provide a casual and friendly response
             "Is parking included?"
         ]
         
-        results = {}
-        for q in test_questions:
-            response = self.generate_response(q, "TestGuest")
-            results[q] = response
-        return results
+        responses = await asyncio.gather(*(self.generate_response(q, "TestGuest") for q in test_questions))
+        return dict(zip(test_questions, responses))
 
     def get_rag_stats(self) -> Dict[str, Any]:
         """Get RAG system statistics"""
-        return property_parser.get_database_stats()
+        return get_property_parser().get_database_stats()
+
+    def clear_response_cache(self):
+        """Drop cached responses, e.g. after the property data was refreshed"""
+        if self.exact_cache is not None:
+            with self._exact_cache_lock:
+                self.exact_cache.clear()
+        self._property_summary = None
+        if self.response_cache:
+            self.response_cache.clear()
+
+# Global instance, built on first access (PEP 562) so importing this module stays cheap
+_ai_generator: Optional[AIResponseGenerator] = None
+_ai_generator_lock = threading.Lock()
+
 
-# Global instance
-ai_generator = AIResponseGenerator()
+def __getattr__(name: str):
+    """Create the global ai_generator lazily"""
+    global _ai_generator
+    if name == "ai_generator":
+        if _ai_generator is None:
+            # Startup and the tests can reach this from several threads at once
+            with _ai_generator_lock:
+                if _ai_generator is None:
+                    _ai_generator = AIResponseGenerator()
+        return _ai_generator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
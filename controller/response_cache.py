@@ -0,0 +1,218 @@
+"""
+Semantic Response Cache for SMS Host Protocol
+Reuses AI responses for guest messages that are similar to ones already answered
+"""
+
+import time
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Placeholder stored instead of the guest name so cached replies work for any guest
+GUEST_NAME_PLACEHOLDER = "{guest_name}"
+
+# Below this many entries an exact scan is both cheap and more accurate than LSH buckets
+EXACT_SEARCH_MAX_ENTRIES = 1024
+
+
+class SemanticResponseCache:
+    """Caches AI responses keyed by the embedding of the guest message"""
+
+    def __init__(self, data_version_fn: Callable[[], str], db_path: str = None, threshold: float = 0.95,
+                 max_entries: int = 10000, n_tables: int = 8, n_bits: int = 16):
+        """
+        Initialize the semantic response cache
+
+        Args:
+            data_version_fn: Function returning the version of the property data, responses
+                answered from any other version are dropped
+            db_path: SQLite file used to persist cached responses
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Entries kept before the least recently used are evicted
+            n_tables: Number of random-projection LSH hash tables
+            n_bits: Sign bits (hyperplanes) per LSH table
+        """
+        self.data_version_fn = data_version_fn
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.n_tables = n_tables
+        self.n_bits = n_bits
+
+        if db_path is None:
+            project_root = Path(__file__).parent.parent
+            self.db_path = project_root / "data" / "response_cache.sqlite"
+        else:
+            self.db_path = Path(db_path).resolve()
+
+        self._lock = threading.Lock()
+        # Entry id -> (embedding, response), least recently used first
+        self._entries: "OrderedDict[int, Tuple[np.ndarray, str]]" = OrderedDict()
+        # Per table: bucket key -> ids of the entries hashed there
+        self._tables: List[Dict[int, set]] = [{} for _ in range(n_tables)]
+        # Hyperplanes are drawn once the embedding size is known, seeded so buckets are stable
+        self._planes: Optional[np.ndarray] = None
+        self._bit_weights = np.left_shift(np.uint64(1), np.arange(n_bits, dtype=np.uint64))
+        # Data version of the entries in memory, they are loaded on first use once it is known
+        self._data_version: Optional[str] = None
+
+        self.db_path.parent.mkdir(exist_ok=True, parents=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "id INTEGER PRIMARY KEY, message TEXT, embedding BLOB, response TEXT, created_at REAL, data_version TEXT)"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+        if "data_version" not in columns:
+            # Rows from before versioning can't be matched to the data they were answered from
+            self._conn.execute("DELETE FROM responses")
+            self._conn.execute("ALTER TABLE responses ADD COLUMN data_version TEXT")
+        self._conn.commit()
+
+        logger.info("Semantic response cache initialized: %s", self.db_path)
+
+    def _sync_data_version(self):
+        """Drop responses answered from other property data and load the current ones (lock held)"""
+        version = self.data_version_fn()
+        if version == self._data_version:
+            return
+
+        self._conn.execute("DELETE FROM responses WHERE data_version IS NOT ?", (version,))
+        self._conn.commit()
+        self._entries.clear()
+        self._tables = [{} for _ in range(self.n_tables)]
+        self._data_version = version
+        self._load()
+        logger.info("Semantic response cache loaded %d entries for the current property data", len(self._entries))
+
+    def _load(self):
+        """Load the most recent persisted entries into memory (lock held)"""
+        rows = self._conn.execute(
+            "SELECT id, embedding, response FROM responses ORDER BY id DESC LIMIT ?", (self.max_entries,)
+        ).fetchall()
+        for entry_id, blob, response in reversed(rows):
+            self._insert(entry_id, np.frombuffer(blob, dtype=np.float32), response)
+
+    def _bucket_keys(self, embedding: np.ndarray) -> np.ndarray:
+        """Hash an embedding to one bucket key per LSH table"""
+        if self._planes is None:
+            rng = np.random.default_rng(0)
+            self._planes = rng.standard_normal((self.n_tables, self.n_bits, embedding.shape[0])).astype(np.float32)
+        bits = (self._planes @ embedding) > 0
+        return bits.astype(np.uint64) @ self._bit_weights
+
+    def _insert(self, entry_id: int, embedding: np.ndarray, response: str):
+        """Add an entry to the in-memory index (lock held by the caller)"""
+        self._entries[entry_id] = (embedding, response)
+        for table, key in zip(self._tables, self._bucket_keys(embedding).tolist()):
+            table.setdefault(key, set()).add(entry_id)
+
+    def _evict_oldest(self) -> int:
+        """Drop the least recently used entry from memory (lock held by the caller)"""
+        entry_id, (embedding, _) = self._entries.popitem(last=False)
+        for table, key in zip(self._tables, self._bucket_keys(embedding).tolist()):
+            bucket = table.get(key)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del table[key]
+        return entry_id
+
+    @staticmethod
+    def normalize(vector: List[float]) -> np.ndarray:
+        """Convert a vector to a unit-length float32 array"""
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def lookup(self, embedding: np.ndarray) -> Optional[str]:
+        """
+        Find a cached response for a message embedding
+
+        Args:
+            embedding: Message embedding returned by normalize()
+
+        Returns:
+            Cached response template, or None on a cache miss
+        """
+        with self._lock:
+            self._sync_data_version()
+            if not self._entries:
+                return None
+
+            if len(self._entries) <= EXACT_SEARCH_MAX_ENTRIES:
+                candidates = list(self._entries)
+            else:
+                candidates = set()
+                for table, key in zip(self._tables, self._bucket_keys(embedding).tolist()):
+                    candidates.update(table.get(key, ()))
+                if not candidates:
+                    return None
+                candidates = list(candidates)
+
+            matrix = np.vstack([self._entries[entry_id][0] for entry_id in candidates])
+            similarities = matrix @ embedding
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                return None
+
+            entry_id = candidates[best]
+            self._entries.move_to_end(entry_id)
+            logger.info("Response cache hit (similarity %.3f)", similarities[best])
+            return self._entries[entry_id][1]
+
+    def add(self, message: str, embedding: np.ndarray, response: str, data_version: Optional[str] = None):
+        """
+        Store a response template for a message embedding
+
+        Args:
+            message: Guest message the response answers
+            embedding: Message embedding returned by normalize()
+            response: Response template
+            data_version: Version of the property data the response was generated from
+                (default: the current one), stale responses are not stored
+        """
+        with self._lock:
+            self._sync_data_version()
+            if data_version is not None and data_version != self._data_version:
+                return
+
+            cursor = self._conn.execute(
+                "INSERT INTO responses (message, embedding, response, created_at, data_version) VALUES (?, ?, ?, ?, ?)",
+                (message, embedding.tobytes(), response, time.time(), self._data_version)
+            )
+            self._insert(cursor.lastrowid, embedding, response)
+
+            evicted = [self._evict_oldest() for _ in range(len(self._entries) - self.max_entries)]
+            if evicted:
+                self._conn.executemany("DELETE FROM responses WHERE id = ?", [(entry_id,) for entry_id in evicted])
+            self._conn.commit()
+
+    def clear(self):
+        """Remove all cached responses (e.g. after the property data changed)"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._entries.clear()
+            self._tables = [{} for _ in range(self.n_tables)]
+
+        logger.info("Semantic response cache cleared")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "threshold": self.threshold,
+            "data_version": self._data_version,
+            "lsh_tables": self.n_tables,
+            "lsh_bits": self.n_bits,
+            "db_path": str(self.db_path)
+        }
@@ -4,30 +4,136 @@ Handles incoming SMS messages and sends AI-generated responses
 """
 
 import os
+import re
+import time
+import random
 import logging
+import asyncio
 from typing import Dict, Any, Optional
+from xml.sax.saxutils import escape
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from twilio.rest import Client
-from twilio.twiml.messaging_response import MessagingResponse
-from .ai_response_generator import ai_generator
+from twilio.base.exceptions import TwilioRestException
+from twilio.http.http_client import TwilioHttpClient
+from . import ai_response_generator
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_NON_DIGIT_RE = re.compile(r"\D")
+
+
+def normalize_phone_number(number: Optional[str]) -> str:
+    """Normalize a phone number to E.164 form ("+" followed by digits only)"""
+    digits = _NON_DIGIT_RE.sub("", number or "")
+    return f"+{digits}" if digits else ""
+
+
+def load_authorized_numbers() -> frozenset:
+    """Normalized GUEST_PHONE_NUMBER plus any comma-separated GUEST_PHONE_NUMBERS"""
+    numbers = [os.getenv("GUEST_PHONE_NUMBER", "")] + os.getenv("GUEST_PHONE_NUMBERS", "").split(",")
+    return frozenset(filter(None, map(normalize_phone_number, numbers)))
+
+
+# Same document MessagingResponse serializes to, filled in without building the XML tree
+TWIML_MESSAGE_TEMPLATE = '<?xml version="1.0" encoding="UTF-8"?><Response><Message>{}</Message></Response>'
+
+WELCOME_MESSAGE_TEMPLATE = (
+    "Hey {guest_name}! 👋 Welcome to our property! I'm your AI host assistant. Feel free to ask me "
+    "anything about your stay - WiFi, check-in times, amenities, nearby attractions, or house rules. "
+    "I'm here to help make your stay perfect! 🏠✨"
+)
+DEFAULT_WELCOME_MESSAGE = WELCOME_MESSAGE_TEMPLATE.format(guest_name="Guest")
+
+# Twilio error codes for "too many requests" and "message queue overflow"
+THROTTLE_ERROR_CODES = (20429, 14107)
+SEND_MAX_RETRIES = 3
+SEND_RETRY_BASE_DELAY = 0.2
+DEFAULT_TWILIO_MPS = 1.0
+DEFAULT_TWILIO_BURST = 5
+
+
+class AsyncTokenBucket:
+    """Token bucket that makes coroutines wait for their turn to send"""
+    
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize the bucket
+        
+        Args:
+            rate: Tokens added per second (messages per second)
+            capacity: Maximum tokens held, i.e. the allowed burst
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        # Lock created lazily for the running event loop
+        self._lock = None
+        self._lock_loop = None
+        self.waiting = 0
+    
+    def _get_lock(self) -> asyncio.Lock:
+        """Get the lock bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            # A contended asyncio.Lock binds to its loop and fails on any other
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+    
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        self.waiting += 1
+        try:
+            # The lock queues waiters in arrival order
+            async with self._get_lock():
+                while True:
+                    now = time.monotonic()
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+        finally:
+            self.waiting -= 1
+
 
 class SMSHandler:
     """Handles SMS messaging for property guest communication"""
     
     def __init__(self):
-        # Initialize Twilio client
-        self.client = Client(
-            os.getenv("TWILIO_ACCOUNT_SID"),
-            os.getenv("TWILIO_AUTH_TOKEN")
-        )
+        # Credentials read once, the status endpoint reports them on every call
+        self.twilio_account_sid = os.getenv("TWILIO_ACCOUNT_SID")
+        auth_token = os.getenv("TWILIO_AUTH_TOKEN")
+        self._auth_token_set = bool(auth_token)
+        
+        # Initialize Twilio client on a pooled keep-alive session
+        self.client = Client(self.twilio_account_sid, auth_token, http_client=self._build_http_client())
         
         # Configuration
         self.twilio_phone = os.getenv("TWILIO_PHONE_NUMBER")
         self.guest_phone = os.getenv("GUEST_PHONE_NUMBER")
+        self._authorized_numbers = load_authorized_numbers()
+        
+        # Twilio already delivers the TwiML reply, also sending it through the REST API duplicates it
+        self.webhook_send_via_api = os.getenv("SMS_WEBHOOK_SEND_VIA_API", "false").lower() == "true"
+        
+        # The unauthorized reply never changes, serialize it once
+        self._unauthorized_twiml = self._generate_twiml_response(
+            "Sorry, this number is not authorized to receive responses from this property."
+        )
+        
+        # Outbound sends scheduled from the webhook, referenced until they finish
+        self._send_tasks = set()
+        
+        # Keep outbound sends within the number's messages-per-second limit
+        self._bucket = AsyncTokenBucket(
+            rate=self._positive_env("TWILIO_MPS", float, DEFAULT_TWILIO_MPS),
+            capacity=self._positive_env("TWILIO_BURST", int, DEFAULT_TWILIO_BURST)
+        )
         
         # Validate configuration
         if not all([self.twilio_phone, self.guest_phone]):
@@ -35,7 +141,32 @@ class SMSHandler:
         
         logger.info(f"SMS Handler initialized - Twilio: {self.twilio_phone}, Guest: {self.guest_phone}")
     
-    def process_incoming_sms(self, from_number: str, message_body: str) -> str:
+    @staticmethod
+    def _positive_env(name: str, parse, default):
+        """Read a positive number from the environment, falling back to the default when it isn't one"""
+        raw = os.getenv(name)
+        if raw is None:
+            return default
+        try:
+            value = parse(raw)
+        except ValueError:
+            value = None
+        # A zero rate would divide by zero and a burst below 1 never grants a token
+        if value is None or not value > 0:
+            logger.warning("Invalid %s=%r, using the default %s", name, raw, default)
+            return default
+        return value
+    
+    @staticmethod
+    def _build_http_client() -> TwilioHttpClient:
+        """Create a Twilio HTTP client whose session keeps TLS connections alive between sends"""
+        http_client = TwilioHttpClient(pool_connections=True)
+        # Retry only idempotent methods (urllib3's default), a retried POST could send an SMS twice
+        retry = Retry(total=2, backoff_factor=0.1, status_forcelist=[429, 500, 502, 503, 504])
+        http_client.session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry))
+        return http_client
+    
+    async def process_incoming_sms(self, from_number: str, message_body: str) -> str:
         """
         Process incoming SMS and generate response
         
@@ -46,71 +177,104 @@ class SMSHandler:
         Returns:
             TwiML response string
         """
-        # Check if message is from the authorized guest number
-        if from_number != self.guest_phone:
-            logger.warning(f"Unauthorized SMS from {from_number}")
+        # Check if message is from an authorized guest number
+        if normalize_phone_number(from_number) not in self._authorized_numbers:
+            logger.warning("Unauthorized SMS from %s", from_number)
             return self._generate_unauthorized_response()
         
-        logger.info(f"Processing SMS from {from_number}: {message_body}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Processing SMS from %s: %s", from_number, message_body)
         
         # Generate AI response
-        ai_response = ai_generator.generate_response(message_body, "Guest")
+        ai_response = await ai_response_generator.ai_generator.generate_response(message_body, "Guest")
         
-        # Send SMS response
-        self._send_sms_response(from_number, ai_response)
+        # Optionally send through the REST API as well, without holding up the TwiML reply
+        if self.webhook_send_via_api:
+            task = asyncio.create_task(self.send_sms(from_number, ai_response))
+            self._send_tasks.add(task)
+            task.add_done_callback(self._on_send_done)
         
         # Return TwiML response for webhook
         return self._generate_twiml_response(ai_response)
     
-    def _send_sms_response(self, to_number: str, message: str):
-        """Send SMS response to guest"""
-        message_obj = self.client.messages.create(
-            body=message,
-            from_=self.twilio_phone,
-            to=to_number
-        )
+    def _on_send_done(self, task: asyncio.Task):
+        """Forget a finished background send and log its failure, if any"""
+        self._send_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Background SMS send failed: %s", task.exception())
+    
+    async def send_sms(self, to_number: str, message: str):
+        """Send an SMS without blocking the event loop"""
+        await self._send_sms_response(to_number, message)
+    
+    async def _send_sms_response(self, to_number: str, message: str):
+        """Send SMS response to guest, rate limited and retried when Twilio throttles"""
+        for attempt in range(SEND_MAX_RETRIES + 1):
+            await self._bucket.acquire()
+            try:
+                # Twilio's client is blocking
+                message_obj = await asyncio.to_thread(
+                    self.client.messages.create,
+                    body=message,
+                    from_=self.twilio_phone,
+                    to=to_number
+                )
+                break
+            except TwilioRestException as e:
+                if e.code not in THROTTLE_ERROR_CODES or attempt == SEND_MAX_RETRIES:
+                    raise
+                delay = SEND_RETRY_BASE_DELAY * 2 ** attempt * (1 + random.random())
+                logger.warning("Twilio throttled the send (code %s), retrying in %.2fs", e.code, delay)
+                await asyncio.sleep(delay)
         
-        logger.info(f"SMS response sent successfully: {message_obj.sid}")
+        logger.info("SMS response sent successfully: %s", message_obj.sid)
     
     def _generate_twiml_response(self, message: str) -> str:
         """Generate TwiML response for webhook"""
-        response = MessagingResponse()
-        response.message(message)
-        return str(response)
+        return TWIML_MESSAGE_TEMPLATE.format(escape(message))
     
     def _generate_unauthorized_response(self) -> str:
         """Generate response for unauthorized numbers"""
-        response = MessagingResponse()
-        response.message("Sorry, this number is not authorized to receive responses from this property.")
-        return str(response)
+        return self._unauthorized_twiml
     
-    def send_welcome_message(self, guest_name: str = "Guest"):
+    async def send_welcome_message(self, guest_name: str = "Guest"):
         """Send a welcome message to the guest"""
-        welcome_message = f"Hey {guest_name}! 👋 Welcome to our property! I'm your AI host assistant. Feel free to ask me anything about your stay - WiFi, check-in times, amenities, nearby attractions, or house rules. I'm here to help make your stay perfect! 🏠✨"
+        if guest_name == "Guest":
+            welcome_message = DEFAULT_WELCOME_MESSAGE
+        else:
+            welcome_message = WELCOME_MESSAGE_TEMPLATE.format(guest_name=guest_name)
         
-        self._send_sms_response(self.guest_phone, welcome_message)
+        await self._send_sms_response(self.guest_phone, welcome_message)
         logger.info("Welcome message sent successfully")
     
-    def send_property_summary(self):
+    async def send_property_summary(self):
         """Send a summary of the property to the guest"""
-        summary = ai_generator.get_property_summary()
-        self._send_sms_response(self.guest_phone, summary)
+        summary = await asyncio.to_thread(ai_response_generator.ai_generator.get_property_summary)
+        await self._send_sms_response(self.guest_phone, summary)
         logger.info("Property summary sent successfully")
     
-    def test_sms_functionality(self):
+    async def test_sms_functionality(self):
         """Test SMS functionality with a test message"""
         test_message = "This is a test message from your AI host assistant! 🏠✨"
-        self._send_sms_response(self.guest_phone, test_message)
+        await self._send_sms_response(self.guest_phone, test_message)
         logger.info("Test SMS sent successfully")
         return True
     
+    def close(self):
+        """Close the pooled HTTP session used for Twilio requests"""
+        session = getattr(self.client.http_client, "session", None)
+        if session is not None:
+            session.close()
+    
     def get_sms_status(self) -> Dict[str, Any]:
         """Get SMS handler status and configuration"""
         return {
             "twilio_phone": self.twilio_phone,
             "guest_phone": self.guest_phone,
-            "twilio_account_sid": os.getenv("TWILIO_ACCOUNT_SID", "Not set"),
-            "twilio_auth_token": "***" if os.getenv("TWILIO_AUTH_TOKEN") else "Not set",
+            "twilio_account_sid": self.twilio_account_sid or "Not set",
+            "twilio_auth_token": "***" if self._auth_token_set else "Not set",
+            "send_rate_mps": self._bucket.rate,
+            "send_queue_depth": self._bucket.waiting,
             "status": "Active" if self.twilio_phone and self.guest_phone else "Inactive"
         }
 
@@ -5,58 +5,153 @@ Entry point for the automated SMS host system using Mistral AI
 """
 
 import asyncio
+import atexit
 import os
 import sys
+import queue
 import logging
+import logging.handlers
 import signal
-from typing import Optional
+import threading
+import time
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Form
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException, Form, Query, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response, StreamingResponse
+import orjson
 import uvicorn
 from datetime import datetime
 
 from controller import sms_protocol, ai_generator, sms_handler
+from config.listing_parser import get_property_parser
 
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('sms_host.log')
-    ]
-)
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that flushes on a timer (and for errors) instead of after every record"""
+    
+    def __init__(self, filename: str, flush_interval: float = 1.0):
+        super().__init__(filename)
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, args=(flush_interval,), name="log-file-flusher", daemon=True
+        )
+        self._flusher.start()
+    
+    def _flush_periodically(self, interval: float):
+        while not self._stop_flushing.wait(interval):
+            self.flush()
+    
+    def emit(self, record: logging.LogRecord):
+        # StreamHandler.emit without the per-record flush; the file object buffers the writes
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+    
+    def close(self):
+        self._stop_flushing.set()
+        super().close()
+
+
+# Configure logging: records go through a queue to a background listener
+# thread, so writing to stdout and the log file never blocks the event loop
+log_queue = queue.Queue(-1)
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Second resolution is enough for these logs, skip the per-record milliseconds formatting
+log_formatter.default_msec_format = None
+stream_handler = logging.StreamHandler(sys.stdout)
+stream_handler.setFormatter(log_formatter)
+file_handler = BufferedFileHandler('sms_host.log')
+file_handler.setFormatter(log_formatter)
+log_listener = logging.handlers.QueueListener(log_queue, stream_handler, file_handler)
+logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(log_queue)])
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Required settings, each read from the environment variable named after the field"""
+    mistral_api_key: Optional[str]
+    twilio_account_sid: Optional[str]
+    twilio_auth_token: Optional[str]
+    twilio_phone_number: Optional[str]
+    guest_phone_number: Optional[str]
+    
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Read every setting from the environment"""
+        return cls(**{f.name: os.getenv(f.name.upper()) for f in fields(cls)})
+    
+    @property
+    def missing_env_vars(self) -> List[str]:
+        """Environment variables that are unset or empty"""
+        return [f.name.upper() for f in fields(self) if not getattr(self, f.name)]
+
+
+# Read once at import, request handlers use these values instead of os.getenv
+CONFIG = Config.from_env()
+
 # Create FastAPI app
 app = FastAPI(
     title="SMS Host Protocol",
     description="A2A Protocol for automated SMS host responses using Mistral AI",
-    version="1.0.0"
+    version="1.0.0",
+    # Serialize JSON responses with orjson instead of the standard json module
+    default_response_class=ORJSONResponse
 )
 
 
+class EventStreamAwareGZipMiddleware(GZipMiddleware):
+    """GZip responses, except the /events stream whose events must reach the browser unbuffered"""
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == "/events":
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Level 1 gets most of the size reduction for text at a fraction of the CPU cost
+app.add_middleware(EventStreamAwareGZipMiddleware, minimum_size=1024, compresslevel=1)
+
+
 class SMSHostApp:
     """Main application class for SMS Host Protocol"""
     
     def __init__(self):
         self.protocol = sms_protocol
         self.running = False
-        
-        # Setup signal handlers
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        # Created by run(), inside the event loop that waits on it
+        self._shutdown_event: Optional[asyncio.Event] = None
         
         logger.info("SMS Host Application initialized")
     
-    def _signal_handler(self, signum, frame):
+    def _install_signal_handlers(self):
+        """Stop the application loop on SIGINT/SIGTERM"""
+        # Only done by run(): under uvicorn the server owns these signals
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._signal_handler, sig)
+            except NotImplementedError:
+                # Windows event loops don't support add_signal_handler
+                signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(self._signal_handler, signum))
+    
+    def _signal_handler(self, signum):
         """Handle shutdown signals"""
-        logger.info(f"Received signal {signum}, shutting down...")
+        logger.info("Received signal %s, shutting down...", signum)
         self.running = False
+        if self._shutdown_event is not None:
+            self._shutdown_event.set()
     
     async def initialize(self) -> bool:
         """Initialize the application"""
@@ -76,23 +171,11 @@ class SMSHostApp:
     
     def _validate_environment(self) -> bool:
         """Validate environment configuration"""
-        required_vars = [
-            "MISTRAL_API_KEY",
-            "TWILIO_ACCOUNT_SID", 
-            "TWILIO_AUTH_TOKEN",
-            "TWILIO_PHONE_NUMBER",
-            "GUEST_PHONE_NUMBER"
-        ]
-        
-        missing_vars = []
-        for var in required_vars:
-            if not os.getenv(var):
-                missing_vars.append(var)
-        
+        missing_vars = CONFIG.missing_env_vars
         if missing_vars:
             logger.error("Missing required environment variables:")
             for var in missing_vars:
-                logger.error(f"  - {var}")
+                logger.error("  - %s", var)
             logger.error("\nPlease check your .env file and ensure all required variables are set.")
             return False
         
@@ -101,10 +184,11 @@ class SMSHostApp:
     async def run(self):
         """Run the main application loop"""
         self.running = True
+        self._shutdown_event = asyncio.Event()
+        self._install_signal_handlers()
         
-        # Keep the application running
-        while self.running:
-            await asyncio.sleep(1)
+        # Sleep until a shutdown signal arrives
+        await self._shutdown_event.wait()
         
         await self.cleanup()
     
@@ -119,15 +203,21 @@ class SMSHostApp:
         logger.info("Cleanup completed")
 
 
-# Global app instance
-app_instance = SMSHostApp()
+# Global app instance, created by whichever entry point starts the application
+app_instance: Optional[SMSHostApp] = None
 
 
 # FastAPI startup event
 @app.on_event("startup")
 async def startup_event():
     """Initialize the application on startup"""
+    global app_instance
     logger.info("Starting SMS Host Application...")
+    # Python 3.12+: tasks that finish without suspending run inline instead of via the ready queue
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    # Built here so each uvicorn worker creates its own instance once it serves traffic
+    app_instance = SMSHostApp()
     if not await app_instance.initialize():
         logger.error("Failed to initialize application")
         raise Exception("Application initialization failed")
@@ -139,16 +229,15 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown"""
     logger.info("Shutting down SMS Host Application...")
-    await app_instance.cleanup()
+    if app_instance is not None:
+        await app_instance.cleanup()
     logger.info("Shutdown completed")
 
 
 # FastAPI Routes
 
-@app.get("/", response_class=HTMLResponse)
-async def root():
-    """Root endpoint with dashboard"""
-    html_content = """
+# Dashboard page, encoded once around the slot for the server-rendered initial state
+DASHBOARD_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -214,66 +303,77 @@ async def root():
         </div>
         
         <script>
+            // Dashboard data rendered into the page by the server, used for the first paint
+            let initialState = __INITIAL_STATE__;
+            
             // Load initial status
             refreshStatus();
             
+            // The server pushes fresh status and conversations whenever a message is processed
+            const events = new EventSource('/events');
+            events.onmessage = (event) => {
+                renderDashboard(JSON.parse(event.data));
+            };
+            
             async function refreshStatus() {
                 try {
-                    const response = await fetch('/status');
-                    const status = await response.json();
-                    
-                    const statusDiv = document.getElementById('status');
-                    const statusClass = status.status === 'Running' ? 'running' : 'stopped';
-                    
-                    statusDiv.innerHTML = `
-                        <div class="status ${statusClass}">
-                            <strong>Status:</strong> ${status.status}<br>
-                            <strong>Property:</strong> ${status.property_name}<br>
-                            <strong>Guest Phone:</strong> ${status.guest_phone}<br>
-                            <strong>Total Messages:</strong> ${status.total_messages}<br>
-                            <strong>Uptime:</strong> ${status.uptime_seconds ? Math.round(status.uptime_seconds / 60) + ' minutes' : 'N/A'}<br>
-                            <strong>AI Model:</strong> ${status.ai_model}<br>
-                            <strong>AI Provider:</strong> ${status.ai_provider}
-                        </div>
-                    `;
-                    
-                    // Load conversations
-                    loadConversations();
-                    // Load RAG stats
-                    loadRAGStats();
+                    // Status, conversations and RAG stats arrive together in one request
+                    let data = initialState;
+                    // Later refreshes fetch fresh data
+                    initialState = null;
+                    if (!data) {
+                        const response = await fetch('/dashboard-data');
+                        data = await response.json();
+                    }
+                    renderDashboard(data);
                     
                 } catch (error) {
                     console.error('Error loading status:', error);
                 }
             }
             
-            async function loadConversations() {
-                try {
-                    const response = await fetch('/conversations');
-                    const conversations = await response.json();
-                    
-                    const conversationsDiv = document.getElementById('conversations');
-                    if (conversations.length === 0) {
-                        conversationsDiv.innerHTML = '<p>No conversations yet.</p>';
-                        return;
-                    }
-                    
-                    let html = '';
-                    conversations.slice(-5).reverse().forEach(conv => {
-                        html += `
-                            <div style="border: 1px solid #ddd; margin: 10px 0; padding: 10px; border-radius: 5px;">
-                                <strong>Guest:</strong> ${conv.guest_message}<br>
-                                <strong>Host:</strong> ${conv.host_response}<br>
-                                <small>${new Date(conv.timestamp).toLocaleString()}</small>
-                            </div>
-                        `;
-                    });
-                    
-                    conversationsDiv.innerHTML = html;
-                    
-                } catch (error) {
-                    console.error('Error loading conversations:', error);
+            function renderDashboard(data) {
+                renderStatus(data.status);
+                renderConversations(data.conversations);
+                renderRAGStats(data.status.rag_stats);
+            }
+            
+            function renderStatus(status) {
+                const statusDiv = document.getElementById('status');
+                const statusClass = status.status === 'Running' ? 'running' : 'stopped';
+                
+                statusDiv.innerHTML = `
+                    <div class="status ${statusClass}">
+                        <strong>Status:</strong> ${status.status}<br>
+                        <strong>Property:</strong> ${status.property_name}<br>
+                        <strong>Guest Phone:</strong> ${status.guest_phone}<br>
+                        <strong>Total Messages:</strong> ${status.total_messages}<br>
+                        <strong>Uptime:</strong> ${status.uptime_seconds ? Math.round(status.uptime_seconds / 60) + ' minutes' : 'N/A'}<br>
+                        <strong>AI Model:</strong> ${status.ai_model}<br>
+                        <strong>AI Provider:</strong> ${status.ai_provider}
+                    </div>
+                `;
+            }
+            
+            function renderConversations(conversations) {
+                const conversationsDiv = document.getElementById('conversations');
+                if (conversations.length === 0) {
+                    conversationsDiv.innerHTML = '<p>No conversations yet.</p>';
+                    return;
                 }
+                
+                let html = '';
+                // Entries arrive newest first, one per guest message or host reply
+                conversations.forEach(conv => {
+                    html += `
+                        <div style="border: 1px solid #ddd; margin: 10px 0; padding: 10px; border-radius: 5px;">
+                            <strong>${conv.role === 'guest' ? 'Guest' : 'Host'}:</strong> ${conv.message}<br>
+                            <small>${new Date(conv.timestamp).toLocaleString()}</small>
+                        </div>
+                    `;
+                });
+                
+                conversationsDiv.innerHTML = html;
             }
             
             async function sendWelcome() {
@@ -327,9 +427,6 @@ async def root():
                         </div>
                     `;
                     
-                    // Refresh status to show new message
-                    setTimeout(refreshStatus, 1000);
-                    
                 } catch (error) {
                     document.getElementById('testResult').innerHTML = `
                         <div style="background-color: #f8d7da; padding: 10px; border-radius: 3px; margin-top: 10px;">
@@ -392,47 +489,149 @@ async def root():
             async function loadRAGStats() {
                 try {
                     const response = await fetch('/rag-stats');
-                    const stats = await response.json();
-                    
-                    const ragStatsDiv = document.getElementById('rag-stats');
-                    if (stats.error) {
-                        ragStatsDiv.innerHTML = `<p style="color: red;">Error: ${stats.error}</p>`;
-                    } else {
-                        ragStatsDiv.innerHTML = `
-                            <p><strong>Total Documents:</strong> ${stats.total_documents || 'N/A'}</p>
-                            <p><strong>Embedding Model:</strong> ${stats.embedding_model || 'N/A'}</p>
-                            <p><strong>Embedding Provider:</strong> ${stats.embedding_provider || 'N/A'}</p>
-                            <p><strong>Chunk Size:</strong> ${stats.chunk_size || 'N/A'}</p>
-                            <p><strong>Data Directory:</strong> ${stats.data_directory || 'N/A'}</p>
-                        `;
-                    }
+                    renderRAGStats(await response.json());
                 } catch (error) {
                     document.getElementById('rag-stats').innerHTML = '<p style="color: red;">Error loading RAG stats</p>';
                 }
             }
+            
+            function renderRAGStats(stats) {
+                const ragStatsDiv = document.getElementById('rag-stats');
+                if (stats.error) {
+                    ragStatsDiv.innerHTML = `<p style="color: red;">Error: ${stats.error}</p>`;
+                } else {
+                    ragStatsDiv.innerHTML = `
+                        <p><strong>Total Documents:</strong> ${stats.total_documents || 'N/A'}</p>
+                        <p><strong>Embedding Model:</strong> ${stats.embedding_model || 'N/A'}</p>
+                        <p><strong>Embedding Provider:</strong> ${stats.embedding_provider || 'N/A'}</p>
+                        <p><strong>Chunk Size:</strong> ${stats.chunk_size || 'N/A'}</p>
+                        <p><strong>Data Directory:</strong> ${stats.data_directory || 'N/A'}</p>
+                    `;
+                }
+            }
         </script>
     </body>
     </html>
     """
-    return html_content
+_DASHBOARD_HEAD, _DASHBOARD_TAIL = (part.encode("utf-8") for part in DASHBOARD_HTML.split("__INITIAL_STATE__"))
+
+
+@app.get("/", response_class=HTMLResponse)
+async def root():
+    """Root endpoint with dashboard"""
+    initial_state = orjson.dumps(await _dashboard_data())
+    # "</" inside the JSON would end the script element early
+    initial_state = initial_state.replace(b"</", b"<\\/")
+    # The page embeds live state, so it must not be served from the browser cache
+    return Response(
+        content=_DASHBOARD_HEAD + initial_state + _DASHBOARD_TAIL,
+        media_type="text/html",
+        headers={"Cache-Control": "no-store"}
+    )
+
+
+class VersionedTTLCache:
+    """Result of a blocking call, reused for `ttl` seconds or until `version()` changes"""
+    
+    def __init__(self, ttl: float, compute: Callable[[], Any], version: Callable[[], int]):
+        self.ttl = ttl
+        self.compute = compute
+        self.version = version
+        # (monotonic time, version, value) of the last computation
+        self._entry: Tuple[float, int, Any] = (0.0, 0, None)
+        self._lock = asyncio.Lock()
+    
+    def _fresh(self) -> Any:
+        """The cached value, or None once it has expired"""
+        cached_at, version, value = self._entry
+        if value is None or version != self.version():
+            return None
+        return value if time.monotonic() - cached_at < self.ttl else None
+    
+    async def get(self) -> Any:
+        """The cached value, recomputed in a thread at most once per ttl"""
+        value = self._fresh()
+        if value is not None:
+            return value
+        # Concurrent requests share one computation
+        async with self._lock:
+            # Another request may have refreshed it while we waited
+            value = self._fresh()
+            if value is not None:
+                return value
+            version = self.version()
+            value = await asyncio.to_thread(self.compute)
+            self._entry = (time.monotonic(), version, value)
+            return value
+
+
+# Dashboard polls reuse these for a second; a new message or a RAG refresh makes them stale.
+# Status includes the vector database stats, which query Chroma synchronously
+STATUS_CACHE_TTL = 1.0
+_status_cache = VersionedTTLCache(
+    STATUS_CACHE_TTL, sms_protocol.get_protocol_status, lambda: sms_protocol.message_count
+)
+_rag_stats_cache = VersionedTTLCache(
+    STATUS_CACHE_TTL, lambda: ai_generator.get_rag_stats(), lambda: get_property_parser().data_version
+)
 
 
 @app.get("/status")
 async def get_status():
     """Get protocol status"""
-    return sms_protocol.get_protocol_status()
+    # Returning a Response skips FastAPI's jsonable_encoder pass over the dict
+    return ORJSONResponse(await _status_cache.get())
+
+
+def _recent_conversations(limit: int) -> List[Dict[str, str]]:
+    """Recent conversation history, newest first"""
+    history = sms_protocol.get_conversation_history(limit)
+    history.reverse()
+    return history
 
 
 @app.get("/conversations")
-async def get_conversations(limit: int = 10):
-    """Get recent conversation history"""
-    return sms_protocol.get_conversation_history(limit)
+async def get_conversations(limit: int = Query(10, ge=1, le=100)):
+    """Get recent conversation history, newest first"""
+    return ORJSONResponse(_recent_conversations(limit))
+
+
+async def _dashboard_data() -> Dict[str, Any]:
+    """Everything the dashboard renders: status (including RAG stats) and recent conversations"""
+    return {"status": await _status_cache.get(), "conversations": _recent_conversations(10)}
+
+
+@app.get("/dashboard-data")
+async def get_dashboard_data():
+    """Get the dashboard's status and conversations in one response"""
+    return ORJSONResponse(await _dashboard_data())
+
+
+# Seconds between keep-alive comments on an idle event stream
+SSE_KEEPALIVE_INTERVAL = 15
+
+
+@app.get("/events")
+async def stream_events(request: Request):
+    """Push status and recent conversations to the dashboard after each processed message"""
+    async def event_stream():
+        while not await request.is_disconnected():
+            try:
+                await asyncio.wait_for(sms_protocol.wait_for_update(), SSE_KEEPALIVE_INTERVAL)
+            except asyncio.TimeoutError:
+                # Comment line, keeps proxies from closing an idle connection
+                yield b": keep-alive\n\n"
+                continue
+            payload = orjson.dumps(await _dashboard_data())
+            yield b"data: " + payload + b"\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
 
 
 @app.post("/send-welcome")
 async def send_welcome():
     """Send welcome message to guest"""
-    success = sms_protocol.send_welcome_message()
+    success = await sms_protocol.send_welcome_message()
     if success:
         return {"message": "Welcome message sent successfully!"}
     else:
@@ -442,7 +641,7 @@ async def send_welcome():
 @app.post("/send-summary")
 async def send_summary():
     """Send property summary to guest"""
-    success = sms_protocol.send_property_summary()
+    success = await sms_protocol.send_property_summary()
     if success:
         return {"message": "Property summary sent successfully!"}
     else:
@@ -452,17 +651,33 @@ async def send_summary():
 @app.post("/test")
 async def test_protocol():
     """Test the protocol functionality"""
-    results = sms_protocol.test_protocol()
+    results = await sms_protocol.test_protocol()
     return {"message": "Protocol test completed", "results": results}
 
 
+# Result of the last Twilio account check as (monotonic expiry, valid, error message)
+TWILIO_CHECK_TTL = 30.0
+_twilio_check: Tuple[float, bool, Optional[str]] = (0.0, False, None)
+
+
+def _check_twilio_account(twilio_sid: str) -> Tuple[bool, Optional[str]]:
+    """Fetch the Twilio account to verify the credentials (blocking HTTPS call)"""
+    try:
+        # Same credentials as the SMS handler, so reuse its client and pooled session
+        sms_handler.client.api.accounts(twilio_sid).fetch()
+        return True, None
+    except Exception as e:
+        return False, str(e)
+
+
 @app.get("/twilio-status")
 async def get_twilio_status():
     """Get Twilio configuration status"""
+    global _twilio_check
     # Get Twilio configuration
-    twilio_sid = os.getenv("TWILIO_ACCOUNT_SID")
-    twilio_phone = os.getenv("TWILIO_PHONE_NUMBER")
-    guest_phone = os.getenv("GUEST_PHONE_NUMBER")
+    twilio_sid = CONFIG.twilio_account_sid
+    twilio_phone = CONFIG.twilio_phone_number
+    guest_phone = CONFIG.guest_phone_number
     
     # Check if credentials are set
     has_sid = bool(twilio_sid)
@@ -474,19 +689,11 @@ async def get_twilio_status():
     error_message = None
     
     if has_sid and has_phone:
-        try:
-            # Test Twilio client initialization
-            from twilio.rest import Client
-            client = Client(twilio_sid, os.getenv("TWILIO_AUTH_TOKEN"))
-            
-            # Try to get account info
-            account = client.api.accounts(twilio_sid).fetch()
-            twilio_valid = True
-            error_message = None
-            
-        except Exception as e:
-            twilio_valid = False
-            error_message = str(e)
+        expires_at, twilio_valid, error_message = _twilio_check
+        if time.monotonic() >= expires_at:
+            # Credentials rarely change, so the round trip to Twilio is reused for a while
+            twilio_valid, error_message = await asyncio.to_thread(_check_twilio_account, twilio_sid)
+            _twilio_check = (time.monotonic() + TWILIO_CHECK_TTL, twilio_valid, error_message)
     
     return {
         "twilio_configured": has_sid and has_phone,
@@ -509,13 +716,13 @@ async def get_twilio_status():
 @app.post("/test-sms")
 async def test_sms():
     """Test SMS functionality by sending a test message"""
-    guest_phone = os.getenv("GUEST_PHONE_NUMBER")
+    guest_phone = CONFIG.guest_phone_number
     if not guest_phone:
         raise HTTPException(status_code=500, detail="GUEST_PHONE_NUMBER not configured")
     
     # Send a test SMS message
     test_message = "🧪 This is a test SMS from your AI host assistant! The system is working perfectly! 🎉"
-    sms_handler._send_sms_response(guest_phone, test_message)
+    await sms_handler.send_sms(guest_phone, test_message)
     
     return {"message": "Test SMS sent successfully", "phone": guest_phone}
 
@@ -523,26 +730,27 @@ async def test_sms():
 @app.post("/test-message")
 async def test_message(message: str = Form(...)):
     """Test message processing and send SMS response"""
-    # Get the guest phone number from environment
-    guest_phone = os.getenv("GUEST_PHONE_NUMBER")
+    # Get the guest phone number from the configuration
+    guest_phone = CONFIG.guest_phone_number
     if not guest_phone:
         raise HTTPException(status_code=500, detail="GUEST_PHONE_NUMBER not configured")
     
     # Process the message and send SMS response
-    response = sms_protocol.process_guest_message(message, from_number=guest_phone)
+    response = await sms_protocol.process_guest_message(message, from_number=guest_phone)
     return {"message": "Message processed and SMS sent successfully", "response": response}
 
 
 @app.get("/rag-stats")
 async def get_rag_stats():
     """Get RAG system statistics"""
-    return ai_generator.get_rag_stats()
+    return ORJSONResponse(await _rag_stats_cache.get())
 
 
 @app.post("/refresh-rag")
 async def refresh_rag_database():
     """Refresh the RAG vector database"""
-    success = sms_protocol.refresh_rag_database()
+    # Rebuilding re-reads and re-embeds the data, keep it off the event loop
+    success = await asyncio.to_thread(sms_protocol.refresh_rag_database)
     if success:
         return {"message": "RAG database refreshed successfully!"}
     else:
@@ -563,7 +771,7 @@ async def update_rag_from_file():
         file_modified = file_stat.st_mtime
         
         # Refresh the RAG database
-        success = sms_protocol.refresh_rag_database()
+        success = await asyncio.to_thread(sms_protocol.refresh_rag_database)
         
         if success:
             return {
@@ -578,14 +786,14 @@ async def update_rag_from_file():
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error updating RAG from file: {e}")
+        logger.error("Error updating RAG from file: %s", e)
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
 
 
 @app.get("/rag-insights/{query}")
 async def get_rag_insights(query: str):
     """Get RAG insights for a specific query"""
-    insights = sms_protocol.get_rag_insights(query)
+    insights = await asyncio.to_thread(sms_protocol.get_rag_insights, query)
     return insights
 
 
@@ -608,7 +816,7 @@ async def get_airbnblisting_status():
         file_modified = file_stat.st_mtime
         
         # Get RAG database stats
-        rag_stats = ai_generator.get_rag_stats()
+        rag_stats = await _rag_stats_cache.get()
         
         return {
             "file_exists": True,
@@ -621,7 +829,7 @@ async def get_airbnblisting_status():
         }
         
     except Exception as e:
-        logger.error(f"Error getting file status: {e}")
+        logger.error("Error getting file status: %s", e)
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
 
 
@@ -639,7 +847,7 @@ async def smart_update_rag():
         current_modified = file_stat.st_mtime
         
         # Get RAG database stats to check if it needs updating
-        rag_stats = ai_generator.get_rag_stats()
+        rag_stats = await asyncio.to_thread(ai_generator.get_rag_stats)
         
         # Check if database exists and has content
         database_needs_update = False
@@ -651,7 +859,7 @@ async def smart_update_rag():
         
         # Always update for now (you can add timestamp comparison logic here)
         if database_needs_update or True:  # Force update for now
-            success = sms_protocol.refresh_rag_database()
+            success = await asyncio.to_thread(sms_protocol.refresh_rag_database)
             
             if success:
                 return {
@@ -661,7 +869,7 @@ async def smart_update_rag():
                     "file_modified_iso": datetime.fromtimestamp(current_modified).isoformat(),
                     "database_updated": True,
                     "reason": reason,
-                    "new_rag_stats": ai_generator.get_rag_stats()
+                    "new_rag_stats": await asyncio.to_thread(ai_generator.get_rag_stats)
                 }
             else:
                 raise HTTPException(status_code=500, detail="Failed to update RAG database")
@@ -679,25 +887,52 @@ async def smart_update_rag():
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in smart update: {e}")
+        logger.error("Error in smart update: %s", e)
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
 
 
+# The health check has only two possible bodies, encoded once
+_HEALTH_RUNNING = orjson.dumps({"status": "healthy", "protocol": "running"})
+_HEALTH_STOPPED = orjson.dumps({"status": "healthy", "protocol": "stopped"})
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "protocol": "running" if sms_protocol.is_running else "stopped"}
+    body = _HEALTH_RUNNING if sms_protocol.is_running else _HEALTH_STOPPED
+    return Response(content=body, media_type="application/json")
+
+
+# uvicorn settings, read from the environment once. "auto" picks the uvloop event loop
+# and the httptools parser installed by uvicorn[standard], falling back to asyncio/h11
+UVICORN_KWARGS: Dict[str, Any] = {
+    "host": os.getenv("HOST", "0.0.0.0"),
+    "port": int(os.getenv("PORT", "8000")),
+    "loop": "auto",
+    "http": "auto",
+    # Each worker process imports main:app and builds its own protocol, Twilio and Mistral clients
+    "workers": int(os.getenv("WORKERS", "1")),
+    # The dashboard polls constantly; per-request access lines only add logging overhead
+    "access_log": os.getenv("ACCESS_LOG", "false").lower() == "true",
+    # Keep idle dashboard connections open between polls
+    "timeout_keep_alive": int(os.getenv("KEEP_ALIVE_TIMEOUT", "30")),
+    # Open /events streams never finish on their own, don't let them hold up shutdown
+    "timeout_graceful_shutdown": 5,
+    "reload": False
+}
 
 
 async def main():
     """Main application entry point"""
+    global app_instance
     # Initialize the application
+    app_instance = SMSHostApp()
     if not await app_instance.initialize():
         logger.error("Failed to initialize application")
         return 1
     
     logger.info("SMS Host Protocol started successfully")
-    logger.info("Access the dashboard at: http://localhost:8000")
+    logger.info("Access the dashboard at: http://localhost:%d", UVICORN_KWARGS["port"])
     
     # Start the application loop
     await app_instance.run()
@@ -707,9 +942,4 @@ async def main():
 
 if __name__ == "__main__":
     # Run the FastAPI app with uvicorn
-    uvicorn.run(
-        "main:app",
-        host=os.getenv("HOST", "0.0.0.0"),
-        port=int(os.getenv("PORT", "8000")),
-        reload=False
-    )
+    uvicorn.run("main:app", **UVICORN_KWARGS)
@@ -0,0 +1,84 @@
+"""
+Test Helpers for SMS Host Protocol
+Runs independent test functions concurrently while keeping each test's output together
+"""
+
+import sys
+import asyncio
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from typing import Any, Callable, Coroutine, List, Sequence, Tuple
+
+# One event loop shared by every test thread: the AI generator's client and
+# batch worker are bound to the loop they were first used on
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def run_async(coro: Coroutine) -> Any:
+    """Run a coroutine on the shared background event loop and wait for its result"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
+
+
+class _ThreadLocalStdout:
+    """sys.stdout stand-in that sends each test thread's prints to its own buffer"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def capture(self) -> StringIO:
+        """Buffer everything the current thread prints from now on"""
+        self._local.buffer = StringIO()
+        return self._local.buffer
+
+    def write(self, text: str) -> int:
+        return getattr(self._local, "buffer", self._stream).write(text)
+
+    def flush(self):
+        getattr(self._local, "buffer", self._stream).flush()
+
+
+def run_tests_concurrently(tests: Sequence[Tuple[str, Callable[[], bool]]], header: Callable[[str], str]
+                           ) -> List[Tuple[str, bool]]:
+    """
+    Run test functions in threads, as they mostly wait on the network
+
+    Args:
+        tests: (name, function) pairs, each function returning whether the test passed
+        header: Returns the line printed before a test's output
+
+    Returns:
+        (name, success) pairs in the order the tests were given
+    """
+    stdout = _ThreadLocalStdout(sys.stdout)
+
+    def run(test_func: Callable[[], bool]) -> Tuple[bool, StringIO]:
+        output = stdout.capture()
+        try:
+            return test_func(), output
+        except Exception:
+            traceback.print_exc(file=output)
+            return False, output
+
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, len(tests))) as executor:
+            futures = [executor.submit(run, test_func) for _, test_func in tests]
+            outcomes = [future.result() for future in futures]
+    finally:
+        sys.stdout = stdout._stream
+
+    results = []
+    for (test_name, _), (success, output) in zip(tests, outcomes):
+        print(header(test_name))
+        print(output.getvalue(), end="")
+        results.append((test_name, success))
+    return results
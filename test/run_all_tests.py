@@ -6,38 +6,74 @@ Runs all tests in the test folder
 
 import os
 import sys
-import subprocess
+import importlib.util
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
 from pathlib import Path
+from typing import List, Tuple
 
-def run_test_file(test_file: str):
-    """Run a specific test file"""
-    print(f"\n{'='*60}")
-    print(f"🧪 Running {test_file}")
-    print(f"{'='*60}")
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Banner line used around each report section
+SEPARATOR = "=" * 60
+
+# Test files that open the property parser. They share vector_db/ and
+# data/response_cache.sqlite, and on a fresh checkout the first one to start
+# builds (and clears) the database, so they run one after another in one worker
+SHARED_STATE_TESTS = ("test_system.py", "test_rag.py")
+
+def _run_test_main(test_file: str) -> int:
+    """Import a test file as a module and return the exit code of its main()"""
+    path = Path(test_file)
+    spec = importlib.util.spec_from_file_location(f"test.{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    try:
+        return module.main() or 0
+    except SystemExit as e:
+        return e.code or 0
+
+def run_test_file(test_file: str) -> Tuple[bool, str, str]:
+    """Run a specific test file in a pool worker and return (success, stdout, stderr)"""
+    # Tests run from the project root like the app does
+    os.chdir(PROJECT_ROOT)
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
     
+    stdout, stderr = StringIO(), StringIO()
     try:
-        result = subprocess.run([sys.executable, test_file], 
-                              capture_output=True, text=True, cwd=Path(__file__).parent.parent)
-        
-        if result.returncode == 0:
-            print("✅ Test completed successfully")
-            print(result.stdout)
-        else:
-            print("❌ Test failed")
-            print(result.stdout)
-            if result.stderr:
-                print("Error output:")
-                print(result.stderr)
-        
-        return result.returncode == 0
-    except Exception as e:
-        print(f"❌ Error running test: {e}")
-        return False
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            returncode = _run_test_main(test_file)
+    except Exception:
+        returncode = 1
+        stderr.write(traceback.format_exc())
+    
+    return returncode == 0, stdout.getvalue(), stderr.getvalue()
+
+def run_test_files(test_files: List[str]) -> List[Tuple[bool, str, str]]:
+    """Run test files one after another in a single pool worker"""
+    return [run_test_file(test_file) for test_file in test_files]
+
+def print_test_result(test_file: str, success: bool, stdout: str, stderr: str):
+    """Print the captured output of a test file"""
+    print(f"\n{SEPARATOR}\n🧪 Running {test_file}\n{SEPARATOR}")
+    
+    if success:
+        print("✅ Test completed successfully")
+        print(stdout)
+    else:
+        print("❌ Test failed")
+        print(stdout)
+        if stderr:
+            print("Error output:")
+            print(stderr)
 
 def main():
     """Run all tests"""
     print("🚀 SMS Host Protocol - Complete Test Suite")
-    print("=" * 60)
+    print(SEPARATOR)
     
     # Get the test directory
     test_dir = Path(__file__).parent
@@ -56,16 +92,27 @@ def main():
     print("\n💡 Note: Some tests may fail if external dependencies (Mistral API, Twilio) are not configured.")
     print("   This is expected in development environments without API keys.")
     
-    # Run all tests
+    # Files touching the shared databases form one sequential group, every other
+    # file gets its own group; the groups mostly wait on APIs and run concurrently
+    shared = [str(f) for f in test_files if f.name in SHARED_STATE_TESTS]
+    groups = [[str(f)] for f in test_files if f.name not in SHARED_STATE_TESTS]
+    if shared:
+        groups.append(shared)
+    
+    with ProcessPoolExecutor(max_workers=min(len(groups), os.cpu_count() or 1)) as executor:
+        outcomes = {}
+        for group, group_outcomes in zip(groups, executor.map(run_test_files, groups)):
+            outcomes.update(zip(group, group_outcomes))
+    
+    # Report in file order once everything has finished
     results = []
     for test_file in test_files:
-        success = run_test_file(str(test_file))
+        success, stdout, stderr = outcomes[str(test_file)]
+        print_test_result(str(test_file), success, stdout, stderr)
         results.append((test_file.name, success))
     
     # Summary
-    print(f"\n{'='*60}")
-    print("📊 TEST SUMMARY")
-    print(f"{'='*60}")
+    print(f"\n{SEPARATOR}\n📊 TEST SUMMARY\n{SEPARATOR}")
     
     passed = sum(1 for _, success in results if success)
     total = len(results)
@@ -8,8 +8,14 @@ import os
 import sys
 from pathlib import Path
 
-# Add parent directory to Python path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to Python path for imports, unless the test runner already did
+PROJECT_ROOT = str(Path(__file__).parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+# Banner lines used in the report
+SEPARATOR = "=" * 60
+SECTION_RULE = "=" * 20
 
 def test_environment():
     """Test environment configuration"""
@@ -23,16 +29,13 @@ def test_environment():
         "GUEST_PHONE_NUMBER"
     ]
     
-    all_good = True
+    env = os.environ
+    missing = [var for var in required_vars if not env.get(var)]
     for var in required_vars:
-        value = os.getenv(var)
-        if value:
-            print(f"✓ {var}: {'*' * len(value)}")
-        else:
-            print(f"❌ {var}: Not set")
-            all_good = False
+        # Fixed-width mask, so the output doesn't reveal how long a secret is
+        print(f"❌ {var}: Not set" if var in missing else f"✓ {var}: ***")
     
-    return all_good
+    return not missing
 
 def test_file_structure():
     """Test that the file structure is correct"""
@@ -46,16 +49,18 @@ def test_file_structure():
         "controller/sms_handler.py"
     ]
     
+    project_root = Path(__file__).resolve().parent.parent
+    
     all_exist = True
     for file in main_files:
-        if Path(__file__).parent.parent / file:
+        if (project_root / file).exists():
             print(f"✓ {file} exists")
         else:
             print(f"❌ {file} missing")
             all_exist = False
     
     # Check if config folder exists
-    config_path = Path(__file__).parent.parent / "config"
+    config_path = project_root / "config"
     if config_path.exists():
         print("✓ config/ folder exists")
     else:
@@ -63,7 +68,7 @@ def test_file_structure():
         all_exist = False
     
     # Check if controller folder exists
-    controller_path = Path(__file__).parent.parent / "controller"
+    controller_path = project_root / "controller"
     if controller_path.exists():
         print("✓ controller/ folder exists")
     else:
@@ -72,26 +77,25 @@ def test_file_structure():
     
     return all_exist
 
+# Test functions run by main(), in report order
+TESTS = (
+    ("Environment Configuration", test_environment),
+    ("File Structure", test_file_structure)
+)
+
 def main():
     """Run basic tests"""
     print("🚀 SMS Host Protocol - Basic Test Suite")
-    print("=" * 60)
-    
-    tests = [
-        ("Environment Configuration", test_environment),
-        ("File Structure", test_file_structure)
-    ]
+    print(SEPARATOR)
     
     results = []
-    for test_name, test_func in tests:
-        print(f"\n{'='*20} {test_name} {'='*20}")
+    for test_name, test_func in TESTS:
+        print(f"\n{SECTION_RULE} {test_name} {SECTION_RULE}")
         success = test_func()
         results.append((test_name, success))
     
     # Summary
-    print("\n" + "="*60)
-    print("📊 BASIC TEST SUMMARY")
-    print("="*60)
+    print(f"\n{SEPARATOR}\n📊 BASIC TEST SUMMARY\n{SEPARATOR}")
     
     passed = sum(1 for _, success in results if success)
     total = len(results)
@@ -8,21 +8,36 @@ import os
 import sys
 from pathlib import Path
 
-# Add parent directory to Python path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to Python path for imports, unless the test runner already did
+PROJECT_ROOT = str(Path(__file__).parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from dotenv import load_dotenv
+from test.helpers import run_async, run_tests_concurrently
 
 # Load environment variables
 load_dotenv()
 
+# Banner lines used in the report
+SEPARATOR = "=" * 60
+WIDE_SEPARATOR = "=" * 70
+
+# (query, k) cases for test_rag_queries: a query may never return more than k chunks
+RAG_QUERY_CASES = (
+    ("WiFi amenities check-in", 3),
+    ("parking", 2),
+    ("check-in", 1)
+)
+
 def test_rag_system():
     """Test the RAG-based property parser with Mistral embeddings"""
     print("🧠 Testing RAG-based Property Parser (Mistral Embeddings)")
-    print("=" * 60)
+    print(SEPARATOR)
     
     # Import the RAG parser
-    from config.listing_parser import property_parser
+    from config.listing_parser import get_property_parser
+    property_parser = get_property_parser()
     
     print("✅ RAG Property Parser imported successfully")
     
@@ -43,11 +58,12 @@ def test_rag_system():
     print(f"Query: '{query}'")
     print(f"Results: {len(results)} chunks found")
     
-    for i, result in enumerate(results[:2], 1):
-        print(f"\nResult {i}:")
-        print(f"Content: {result['content'][:100]}...")
-        print(f"Score: {result['relevance_score']:.4f}")
-        print(f"Source: {result['source']}")
+    # Format all results first and write them with a single print
+    print("".join(
+        f"\nResult {i}:\nContent: {result.content[:100]}...\n"
+        f"Score: {result.relevance_score:.4f}\nSource: {result.source}\n"
+        for i, result in enumerate(results[:2], 1)
+    ), end="")
     
     # Test AI context formatting
     print("\n🤖 Testing AI Context Formatting...")
@@ -58,10 +74,32 @@ def test_rag_system():
     print("🧠 Mistral Embeddings: Working perfectly!")
     return True
 
+def test_rag_queries():
+    """Run each RAG_QUERY_CASES query and check the number of chunks returned"""
+    print("\n🔍 Testing RAG Query Cases")
+    print(SEPARATOR)
+    
+    from config.listing_parser import get_property_parser
+    property_parser = get_property_parser()
+    
+    # One embeddings request covers every case
+    property_parser.embed_queries([query for query, _ in RAG_QUERY_CASES])
+    
+    all_good = True
+    for query, k in RAG_QUERY_CASES:
+        results = property_parser.query_property_info(query, k=k)
+        if len(results) <= k:
+            print(f"✓ '{query}' (k={k}): {len(results)} chunks")
+        else:
+            print(f"❌ '{query}' (k={k}): {len(results)} chunks")
+            all_good = False
+    
+    return all_good
+
 def test_ai_generator_with_rag():
     """Test AI response generator with RAG and Mistral embeddings"""
     print("\n🤖 Testing AI Response Generator with RAG (Mistral)")
-    print("=" * 60)
+    print(SEPARATOR)
     
     from controller.ai_response_generator import ai_generator
     
@@ -74,9 +112,10 @@ def test_ai_generator_with_rag():
         "Is parking included?"
     ]
     
-    for question in test_questions:
+    # One embeddings request covers all questions, the completions then run concurrently
+    responses = run_async(ai_generator.generate_responses(test_questions, "TestGuest"))
+    for question, response in zip(test_questions, responses):
         print(f"\nQuestion: {question}")
-        response = ai_generator.generate_response(question, "TestGuest")
         print(f"Response: {response}")
     
     # Test RAG stats
@@ -88,28 +127,26 @@ def test_ai_generator_with_rag():
     print("🧠 Mistral AI + Mistral Embeddings: Perfect combination!")
     return True
 
+# Test functions run by main(), in report order
+TESTS = (
+    ("RAG Property Parser (Mistral)", test_rag_system),
+    ("RAG Query Cases", test_rag_queries),
+    ("AI Generator with RAG (Mistral)", test_ai_generator_with_rag)
+)
+
 def main():
     """Run all RAG tests"""
     print("🚀 RAG Architecture Test Suite (Mistral Embeddings)")
-    print("=" * 70)
-    
-    tests = [
-        ("RAG Property Parser (Mistral)", test_rag_system),
-        ("AI Generator with RAG (Mistral)", test_ai_generator_with_rag)
-    ]
+    print(WIDE_SEPARATOR)
     
-    total = len(tests)
-    passed = 0
+    total = len(TESTS)
     
-    for name, func in tests:
-        print(f"\n--- Running Test: {name} ---")
-        if func():
-            passed += 1
+    # The tests mostly wait on Mistral, run them concurrently
+    results = run_tests_concurrently(TESTS, lambda name: f"\n--- Running Test: {name} ---")
+    passed = sum(1 for _, success in results if success)
     
     # Summary
-    print("\n" + "="*70)
-    print("📊 RAG TEST SUMMARY")
-    print("="*70)
+    print(f"\n{WIDE_SEPARATOR}\n📊 RAG TEST SUMMARY\n{WIDE_SEPARATOR}")
     
     print(f"Total Tests: {total}")
     print(f"Passed: {passed}")
@@ -8,19 +8,27 @@ import os
 import sys
 from pathlib import Path
 
-# Add parent directory to Python path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to Python path for imports, unless the test runner already did
+PROJECT_ROOT = str(Path(__file__).parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from dotenv import load_dotenv
+from test.helpers import run_async, run_tests_concurrently
 
 # Load environment variables
 load_dotenv()
 
+# Banner lines used in the report
+SEPARATOR = "=" * 60
+SECTION_RULE = "=" * 20
+
 def test_property_parser():
     """Test the property parser functionality"""
     print("🧪 Testing Property Parser...")
     
-    from config.listing_parser import property_parser
+    from config.listing_parser import get_property_parser
+    property_parser = get_property_parser()
     
     # Test basic functionality
     property_name = property_parser.get_property_name()
@@ -48,8 +56,9 @@ def test_ai_generator():
         "Is parking included?"
     ]
     
-    for question in test_questions:
-        response = ai_generator.generate_response(question, "Test Guest")
+    # The questions are independent, generate the answers concurrently
+    responses = run_async(ai_generator.generate_responses(test_questions, "Test Guest"))
+    for question, response in zip(test_questions, responses):
         print(f"✓ Q: {question}")
         print(f"  A: {response}")
     
@@ -71,7 +80,7 @@ def test_protocol():
     
     # Test message processing (without SMS)
     test_message = "Do you have WiFi?"
-    response = sms_protocol.process_guest_message(test_message)
+    response = run_async(sms_protocol.process_guest_message(test_message))
     print(f"✓ Test Message: {test_message}")
     print(f"✓ Response: {response}")
     
@@ -89,40 +98,38 @@ def test_environment():
         "GUEST_PHONE_NUMBER"
     ]
     
-    all_good = True
+    env = os.environ
+    missing = [var for var in required_vars if not env.get(var)]
     for var in required_vars:
-        value = os.getenv(var)
-        if value:
-            print(f"✓ {var}: {'*' * len(value)}")
-        else:
-            print(f"❌ {var}: Not set")
-            all_good = False
-    
-    return all_good
+        # Fixed-width mask, so the output doesn't reveal how long a secret is
+        print(f"❌ {var}: Not set" if var in missing else f"✓ {var}: ***")
+    
+    return not missing
+
+# Test functions run by main() after the environment check, in report order
+TESTS = (
+    ("Property Parser", test_property_parser),
+    ("AI Response Generator (Mistral)", test_ai_generator),
+    ("SMS Host Protocol", test_protocol)
+)
 
 def main():
     """Run all tests"""
     print("🚀 SMS Host Protocol - System Test (Mistral AI)")
-    print("=" * 60)
+    print(SEPARATOR)
     
-    tests = [
-        ("Environment Configuration", test_environment),
-        ("Property Parser", test_property_parser),
-        ("AI Response Generator (Mistral)", test_ai_generator),
-        ("SMS Host Protocol", test_protocol)
-    ]
+    def header(test_name):
+        return f"\n{SECTION_RULE} {test_name} {SECTION_RULE}"
     
-    results = []
+    # The environment is checked first, the other tests depend on it
+    print(header("Environment Configuration"))
+    results = [("Environment Configuration", test_environment())]
     
-    for test_name, test_func in tests:
-        print(f"\n{'='*20} {test_name} {'='*20}")
-        success = test_func()
-        results.append((test_name, success))
+    # The remaining tests mostly wait on Mistral, run them concurrently
+    results += run_tests_concurrently(TESTS, header)
     
     # Summary
-    print("\n" + "="*60)
-    print("📊 TEST SUMMARY")
-    print("="*60)
+    print(f"\n{SEPARATOR}\n📊 TEST SUMMARY\n{SEPARATOR}")
     
     passed = 0
     total = len(results)